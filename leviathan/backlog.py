@@ -4,26 +4,34 @@ Handles loading, parsing, and updating agent_backlog.yaml.
 """
 import yaml
 from pathlib import Path
-from typing import List, Dict, Optional, Any
-from dataclasses import dataclass
+from typing import List, Dict, Optional, Any, Tuple
+from dataclasses import dataclass, replace
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Task:
-    """Represents a single task from the backlog."""
+    """Represents a single task from the backlog (immutable; update via dataclasses.replace)."""
     id: str
     title: str
     scope: str
     priority: str
     ready: bool
-    allowed_paths: List[str]
-    acceptance_criteria: List[str]
-    dependencies: List[str]
+    allowed_paths: Tuple[str, ...]  # lists are accepted and converted in __post_init__
+    acceptance_criteria: Tuple[str, ...]
+    dependencies: Tuple[str, ...]
     estimated_size: str
     status: Optional[str] = None  # pr_opened, ready_to_merge, blocked, completed
     pr_number: Optional[int] = None
     branch_name: Optional[str] = None
     
+    def __post_init__(self):
+        """Convert list fields to tuples once, at construction."""
+        # Non-list values (e.g. a bare string) are left as-is for callers to reject
+        for name in ('allowed_paths', 'acceptance_criteria', 'dependencies'):
+            value = getattr(self, name)
+            if isinstance(value, list):
+                object.__setattr__(self, name, tuple(value))
+    
     @property
     def priority_value(self) -> int:
         """Convert priority to numeric value for sorting."""
@@ -37,9 +45,9 @@ class Task:
             'scope': self.scope,
             'priority': self.priority,
             'ready': self.ready,
-            'allowed_paths': self.allowed_paths,
-            'acceptance_criteria': self.acceptance_criteria,
-            'dependencies': self.dependencies,
+            'allowed_paths': list(self.allowed_paths),
+            'acceptance_criteria': list(self.acceptance_criteria),
+            'dependencies': list(self.dependencies),
             'estimated_size': self.estimated_size,
         }
         if self.status:
@@ -123,13 +131,13 @@ class Backlog:
         """
         changed = False
         
-        for task in self.tasks:
+        for i, task in enumerate(self.tasks):
             if task.status == 'pr_opened':
                 # Check if task has a branch name and if it's still open
                 if hasattr(task, 'branch_name') and task.branch_name:
                     if task.branch_name not in open_pr_branches:
                         # PR was merged or closed, mark as completed
-                        task.status = 'completed'
+                        self.tasks[i] = replace(task, status='completed')
                         changed = True
         
         # Save if any changes were made
@@ -179,11 +187,13 @@ class Backlog:
     
     def update_task_status(self, task_id: str, status: str, pr_number: Optional[int] = None, branch_name: Optional[str] = None):
         """Update task status and save."""
-        task = self.get_task(task_id)
-        if task:
-            task.status = status
-            if pr_number:
-                task.pr_number = pr_number
-            if branch_name:
-                task.branch_name = branch_name
-            self.save()
+        for i, task in enumerate(self.tasks):
+            if task.id == task_id:
+                changes = {'status': status}
+                if pr_number:
+                    changes['pr_number'] = pr_number
+                if branch_name:
+                    changes['branch_name'] = branch_name
+                self.tasks[i] = replace(task, **changes)
+                self.save()
+                return
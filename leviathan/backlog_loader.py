@@ -4,10 +4,34 @@ Backlog loader utility for normalizing backlog YAML formats.
 Supports both formats:
 1. Dict with 'tasks' key: {tasks: [...]}
 2. Top-level list: [...]
+
+Backlogs stored as .json (same shapes) are decoded with orjson instead.
 """
+import functools
+import re
+import orjson
 import yaml
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_backlog_file(path: str, mtime_ns: int, size: int) -> Any:
+    """
+    Parse a backlog YAML (or .json) file, cached by (path, mtime_ns, size).
+    
+    The returned document is shared between callers and must not be mutated.
+    """
+    if path.endswith('.json'):
+        with open(path, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
 
 
 def load_backlog_tasks(backlog_path: Path) -> List[Dict[str, Any]]:
@@ -31,8 +55,8 @@ def load_backlog_tasks(backlog_path: Path) -> List[Dict[str, Any]]:
     if not backlog_path.exists():
         raise FileNotFoundError(f"Backlog not found: {backlog_path}")
     
-    with open(backlog_path, 'r') as f:
-        data = yaml.safe_load(f)
+    stat = backlog_path.stat()
+    data = _parse_backlog_file(str(backlog_path), stat.st_mtime_ns, stat.st_size)
     
     # Normalize to list of tasks
     if isinstance(data, dict):
@@ -68,6 +92,9 @@ def load_backlog_tasks(backlog_path: Path) -> List[Dict[str, Any]]:
                 f"expected dict, got {type(task).__name__}"
             )
         
+        # Copy so normalization never touches the cached document
+        task = dict(task)
+        
         # Ensure 'id' field exists (some backlogs may use 'task_id')
         if 'id' not in task and 'task_id' in task:
             task['id'] = task['task_id']
@@ -83,6 +110,146 @@ def load_backlog_tasks(backlog_path: Path) -> List[Dict[str, Any]]:
     return normalized_tasks
 
 
+def _slice_task_block(lines: List[str], task_id: str) -> Optional[str]:
+    """
+    Find the YAML list item for task_id without parsing the whole document.
+    
+    Locates the `id: <task_id>` (or `task_id: <task_id>`) line, walks back to
+    the owning `- ` list marker and forward until the next line at or above
+    that indentation.
+    
+    Args:
+        lines: Backlog file lines
+        task_id: Task identifier to find
+        
+    Returns:
+        Dedented YAML text for the single task item, or None if not found
+        or the id is declared more than once
+    """
+    id_line = re.compile(
+        r'^[ ]*(?:- )?(?:id|task_id):[ ]*[\'"]?' + re.escape(task_id) + r'[\'"]?[ ]*$'
+    )
+    
+    # The slice skips the rest of the document, so only trust it when the id
+    # is declared exactly once; loose matching also counts lines id_line
+    # would miss (trailing comments, flow style), which all force a full parse
+    id_mention = re.compile(r'\b(?:task_)?id:.*' + re.escape(task_id) + r'(?![\w.-])').search
+    if sum(1 for line in lines if id_mention(line)) != 1:
+        return None
+    
+    # Column of the first top-level list marker (the tasks list)
+    list_col = None
+    for line in lines:
+        stripped = line.lstrip(' ')
+        if stripped.startswith('- '):
+            list_col = len(line) - len(stripped)
+            break
+    if list_col is None:
+        return None
+    
+    for i, line in enumerate(lines):
+        match = id_line.match(line.rstrip('\r\n'))
+        if not match:
+            continue
+        
+        # Walk back to the list marker that owns this key
+        start = None
+        for j in range(i, -1, -1):
+            stripped = lines[j].lstrip(' ')
+            if stripped.startswith('- ') and len(lines[j]) - len(stripped) == list_col:
+                start = j
+                break
+        if start is None:
+            return None
+        
+        # Walk forward to the next line at or above the marker's indentation
+        end = len(lines)
+        for k in range(start + 1, len(lines)):
+            stripped = lines[k].lstrip(' ')
+            if not stripped.strip() or stripped.startswith('#'):
+                continue
+            if len(lines[k]) - len(stripped) <= list_col:
+                end = k
+                break
+        
+        return ''.join(line[list_col:] for line in lines[start:end])
+    
+    return None
+
+
+def load_backlog_task(backlog_path: Path, task_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Load a single task by ID from a backlog YAML file.
+    
+    Parses only the matching task's YAML block when it can be located
+    textually and its id occurs once; falls back to load_backlog_tasks() on
+    a miss, a possibly duplicated id, or when the slice does not parse to
+    the expected task. Results are cached by
+    (path, mtime_ns, size, task_id), so repeat loads of an unchanged file
+    skip the read and parse.
+    
+    Args:
+        backlog_path: Path to backlog YAML file
+        task_id: Task identifier to find
+        
+    Returns:
+        Normalized task dict, or None if no task has that ID
+        
+    Raises:
+        FileNotFoundError: If backlog file doesn't exist
+        ValueError: If backlog format is invalid (full-parse fallback only)
+    """
+    try:
+        stat = backlog_path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Backlog not found: {backlog_path}") from None
+    
+    task = _load_backlog_task_cached(str(backlog_path), stat.st_mtime_ns, stat.st_size, task_id)
+    # Copy so callers never mutate the cached dict
+    return dict(task) if task is not None else None
+
+
+@functools.lru_cache(maxsize=32)
+def _load_backlog_task_cached(
+    path: str, mtime_ns: int, size: int, task_id: str
+) -> Optional[Dict[str, Any]]:
+    """Cached worker for load_backlog_task(); the returned dict is shared and must not be mutated."""
+    # JSON decodes fast enough that slicing out one task buys nothing
+    block = None
+    if not path.endswith('.json'):
+        with open(path, 'r') as f:
+            block = _slice_task_block(f.readlines(), task_id)
+    
+    if block is not None:
+        try:
+            items = yaml.load(block, Loader=_YamlLoader)
+        except yaml.YAMLError:
+            items = None
+        
+        if isinstance(items, list) and len(items) == 1 and isinstance(items[0], dict):
+            task = items[0]
+            if 'id' not in task and 'task_id' in task:
+                task['id'] = task['task_id']
+            if task.get('id') == task_id:
+                return task
+    
+    # Fallback: full parse, looked up through the per-file id index
+    return _index_backlog_file(path, mtime_ns, size).get(task_id)
+
+
+@functools.lru_cache(maxsize=32)
+def _index_backlog_file(path: str, mtime_ns: int, size: int) -> Dict[str, Dict[str, Any]]:
+    """
+    Map task id -> normalized task for a backlog file, cached like _parse_backlog_file.
+    
+    The first task wins on duplicate ids, matching a linear scan.
+    """
+    index: Dict[str, Dict[str, Any]] = {}
+    for task in load_backlog_tasks(Path(path)):
+        index.setdefault(task['id'], task)
+    return index
+
+
 def filter_ready_tasks(tasks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     Filter tasks to only those marked as ready.
@@ -20,31 +20,104 @@ Environment variables:
     LEVIATHAN_CLAUDE_MODEL: Claude model name
     LEVIATHAN_WORKSPACE_DIR: Optional workspace directory override (for local runs)
 """
+import functools
 import os
 import sys
 import uuid
 import json
 import subprocess
 import re
+import time
 import yaml
+from collections import deque
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import Dict, Any, List, Optional, Tuple
 
+import orjson
 import requests
 
 from leviathan.artifacts.store import ArtifactStore
 from leviathan.model_client import ModelClient
 from leviathan.rewrite_mode import RewriteModeError
 from leviathan.backlog import Task
-from leviathan.backlog_loader import load_backlog_tasks
+from leviathan.backlog_loader import load_backlog_task
 from leviathan.bootstrap.indexer import RepositoryIndexer, load_bootstrap_config
 from leviathan.topology.indexer import TopologyIndexer
 
 
+# owner/repo from HTTPS (github.com/owner/repo) or SSH (github.com:owner/repo) URLs
+GITHUB_REPO_RE = re.compile(r'github\.com[:/]([^/]+)/([^/.]+)')
+
+# System-scope task id prefix -> scope; ids look like <prefix><target>-v1
+SYSTEM_SCOPE_PREFIXES = (
+    ("topology-", "topology"),
+    ("bootstrap-", "bootstrap"),
+)
+
+# Workspace roots tried in order when LEVIATHAN_WORKSPACE_DIR is unset: the
+# first writable one wins, and the last is created if none is (K8s, then local)
+DEFAULT_WORKSPACE_CANDIDATES = (
+    Path("/workspace"),
+    Path("/tmp/leviathan-workspace"),
+)
+
+# Post buffered events early once this many accumulate (caps memory on chatty attempts)
+EVENT_FLUSH_THRESHOLD = 512
+
+# Naive UTC epoch, so converted timestamps match datetime.utcnow().isoformat()
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _event_for_wire(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Replace a buffered event's integer ts_ns with the ISO timestamp the API expects."""
+    if 'ts_ns' not in event:
+        # Indexer events arrive with an ISO timestamp already
+        return event
+    wire = dict(event)
+    wire['timestamp'] = (_EPOCH + timedelta(microseconds=wire.pop('ts_ns') // 1000)).isoformat()
+    return wire
+
+
 class WorkerError(Exception):
     """Worker execution error."""
-    pass
+    __slots__ = ()
+
+
+class _TTLCache:
+    """
+    Short-lived response cache for GitHub API reads.
+    
+    Entries are stamped with a time.monotonic() bucket of width ttl and are
+    dropped once the bucket rolls over, so calls made seconds apart (retries,
+    repeated lookups) share one API request.
+    """
+    
+    def __init__(self, ttl: float = 60.0):
+        self.ttl = ttl
+        self._entries = {}
+    
+    def _bucket(self) -> int:
+        return int(time.monotonic() // self.ttl)
+    
+    def get(self, key):
+        """Return cached value for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        bucket, value = entry
+        if bucket != self._bucket():
+            del self._entries[key]
+            return None
+        return value
+    
+    def set(self, key, value):
+        """Cache value for key in the current bucket."""
+        self._entries[key] = (self._bucket(), value)
+    
+    def pop(self, key):
+        """Drop key if cached."""
+        self._entries.pop(key, None)
 
 
 class Worker:
@@ -61,8 +134,18 @@ class Worker:
     7. Exit
     """
     
-    def __init__(self):
-        """Initialize worker from environment."""
+    # Set on the instance once an early event flush fails (see _emit_event)
+    _early_flush_disabled = False
+    
+    def __init__(self, workspace_candidates: Optional[List[Path]] = None):
+        """
+        Initialize worker from environment.
+        
+        Args:
+            workspace_candidates: Workspace roots to try in place of
+                DEFAULT_WORKSPACE_CANDIDATES (LEVIATHAN_WORKSPACE_DIR still wins)
+        """
+        self.workspace_candidates = list(workspace_candidates or DEFAULT_WORKSPACE_CANDIDATES)
         self.target_name = os.getenv("TARGET_NAME")
         self.target_repo_url = os.getenv("TARGET_REPO_URL")
         self.target_branch = os.getenv("TARGET_BRANCH", "main")
@@ -89,8 +172,15 @@ class Worker:
         # Use default artifact store (same as control plane: ~/.leviathan/artifacts)
         self.artifact_store = ArtifactStore()
         
-        self.events = []
+        self.events = deque()
         self.artifacts = []
+        self._api_cache = _TTLCache()  # (method, url) -> GitHub API response data
+        self._auth_url_cache: Dict[Tuple[str, str], str] = {}  # (repo_url, token) -> authenticated URL
+    
+    @functools.cached_property
+    def _actor_id(self) -> str:
+        """Actor ID stamped on every emitted event."""
+        return f"worker-{self.attempt_id}"
     
     def _get_workspace_root(self) -> Path:
         """
@@ -98,8 +188,8 @@ class Worker:
         
         Priority:
         1. LEVIATHAN_WORKSPACE_DIR env var (explicit override)
-        2. /workspace if writable (K8s default)
-        3. /tmp/leviathan-workspace (local fallback)
+        2. First writable entry of workspace_candidates (/workspace, the K8s default)
+        3. Last entry of workspace_candidates, created if needed (/tmp/leviathan-workspace)
         
         Returns:
             Path to workspace root (includes attempt_id subdirectory)
@@ -111,38 +201,31 @@ class Worker:
             workspace_root.mkdir(parents=True, exist_ok=True)
             return workspace_root
         
-        # Try /workspace (K8s default)
-        k8s_workspace = Path("/workspace")
-        if self._is_writable(k8s_workspace):
-            workspace_root = k8s_workspace / self.attempt_id
-            workspace_root.mkdir(parents=True, exist_ok=True)
-            return workspace_root
+        # First writable candidate; otherwise fall back to the last one
+        base = self.workspace_candidates[-1]
+        for candidate in self.workspace_candidates[:-1]:
+            if self._is_writable(candidate):
+                base = candidate
+                break
         
-        # Fallback to /tmp (local execution)
-        tmp_workspace = Path("/tmp/leviathan-workspace") / self.attempt_id
-        tmp_workspace.mkdir(parents=True, exist_ok=True)
-        return tmp_workspace
+        workspace_root = base / self.attempt_id
+        workspace_root.mkdir(parents=True, exist_ok=True)
+        return workspace_root
     
     def _is_writable(self, path: Path) -> bool:
         """
         Check if directory exists and is writable.
         
+        Uses os.access(W_OK), which also reports read-only mounts (EROFS),
+        rather than creating and removing a probe file.
+        
         Args:
             path: Directory path to check
             
         Returns:
             True if writable, False otherwise
         """
-        try:
-            if not path.exists():
-                return False
-            # Try to create a test file
-            test_file = path / f".write_test_{os.getpid()}"
-            test_file.touch()
-            test_file.unlink()
-            return True
-        except (OSError, PermissionError):
-            return False
+        return path.is_dir() and os.access(path, os.W_OK)
     
     def run(self) -> int:
         """
@@ -318,65 +401,52 @@ class Worker:
         Returns:
             Task object with typed fields
         """
-        backlog_path = self.target_dir / ".leviathan" / "backlog.yaml"
+        # Prefer a JSON backlog (orjson) over YAML when a target ships one
+        backlog_path = self.target_dir / ".leviathan" / "backlog.json"
+        if not backlog_path.exists():
+            backlog_path = backlog_path.with_name("backlog.yaml")
         
         # Try to load from backlog if it exists
         if backlog_path.exists():
-            # Load and normalize tasks using backlog_loader
-            tasks = load_backlog_tasks(backlog_path)
+            # Load only the matching task (normalized) using backlog_loader
+            task_dict = load_backlog_task(backlog_path, self.task_id)
             
-            # Find task by ID
-            for task_dict in tasks:
-                if task_dict.get('id') == self.task_id:
-                    # Convert dict to Task object
-                    return Task(
-                        id=task_dict['id'],
-                        title=task_dict.get('title', 'Untitled'),
-                        scope=task_dict.get('scope', 'unknown'),
-                        priority=task_dict.get('priority', 'medium'),
-                        ready=task_dict.get('ready', True),
-                        allowed_paths=task_dict.get('allowed_paths', []),
-                        acceptance_criteria=task_dict.get('acceptance_criteria', []),
-                        dependencies=task_dict.get('dependencies', []),
-                        estimated_size=task_dict.get('estimated_size', 'unknown'),
-                        status=task_dict.get('status'),
-                        pr_number=task_dict.get('pr_number'),
-                        branch_name=task_dict.get('branch_name')
-                    )
+            if task_dict is not None:
+                # Convert dict to Task object
+                return Task(
+                    id=task_dict['id'],
+                    title=task_dict.get('title', 'Untitled'),
+                    scope=task_dict.get('scope', 'unknown'),
+                    priority=task_dict.get('priority', 'medium'),
+                    ready=task_dict.get('ready', True),
+                    allowed_paths=task_dict.get('allowed_paths', []),
+                    acceptance_criteria=task_dict.get('acceptance_criteria', []),
+                    dependencies=task_dict.get('dependencies', []),
+                    estimated_size=task_dict.get('estimated_size', 'unknown'),
+                    status=task_dict.get('status'),
+                    pr_number=task_dict.get('pr_number'),
+                    branch_name=task_dict.get('branch_name')
+                )
         
         # System-scope fallback: check if this is a recognized system task
-        if self.task_id.startswith('topology-') and self.task_id.endswith('-v1'):
-            print(f"Task not found in backlog, using system-scope fallback for topology task")
-            return Task(
-                id=self.task_id,
-                title=f"SYSTEM: topology index for {self.target_name}",
-                scope='topology',
-                priority='high',
-                ready=True,
-                allowed_paths=[],
-                acceptance_criteria=[],
-                dependencies=[],
-                estimated_size='small',
-                status=None,
-                pr_number=None,
-                branch_name=None
-            )
-        elif self.task_id.startswith('bootstrap-') and self.task_id.endswith('-v1'):
-            print(f"Task not found in backlog, using system-scope fallback for bootstrap task")
-            return Task(
-                id=self.task_id,
-                title=f"SYSTEM: bootstrap index for {self.target_name}",
-                scope='bootstrap',
-                priority='high',
-                ready=True,
-                allowed_paths=[],
-                acceptance_criteria=[],
-                dependencies=[],
-                estimated_size='small',
-                status=None,
-                pr_number=None,
-                branch_name=None
-            )
+        if self.task_id.endswith('-v1'):
+            for prefix, scope in SYSTEM_SCOPE_PREFIXES:
+                if self.task_id.startswith(prefix):
+                    print(f"Task not found in backlog, using system-scope fallback for {scope} task")
+                    return Task(
+                        id=self.task_id,
+                        title=f"SYSTEM: {scope} index for {self.target_name}",
+                        scope=scope,
+                        priority='high',
+                        ready=True,
+                        allowed_paths=[],
+                        acceptance_criteria=[],
+                        dependencies=[],
+                        estimated_size='small',
+                        status=None,
+                        pr_number=None,
+                        branch_name=None
+                    )
         
         # Not a system task and not in backlog
         raise WorkerError(
@@ -400,7 +470,7 @@ class Worker:
         print(f"Allowed paths: {len(task_spec.allowed_paths)} file(s)")
         
         # Validate allowed_paths
-        if not isinstance(task_spec.allowed_paths, list):
+        if not isinstance(task_spec.allowed_paths, (list, tuple)):
             raise WorkerError(f"Task {task_spec.id}: allowed_paths must be a list, got {type(task_spec.allowed_paths).__name__}")
         
         # Initialize model client
@@ -733,14 +803,20 @@ Status: Success
         Returns:
             Authenticated URL (token not logged)
         """
+        key = (repo_url, token)
+        cached = self._auth_url_cache.get(key)
+        if cached is not None:
+            return cached
+        
         # Convert SSH to HTTPS if needed
         if repo_url.startswith("git@github.com:"):
             repo_url = repo_url.replace("git@github.com:", "https://github.com/")
         
         # Inject token
         if "https://" in repo_url:
-            return repo_url.replace("https://", f"https://x-access-token:{token}@")
+            repo_url = repo_url.replace("https://", f"https://x-access-token:{token}@")
         
+        self._auth_url_cache[key] = repo_url
         return repo_url
     
     def _extract_repo_info(self, repo_url: str) -> Tuple[str, str]:
@@ -756,7 +832,7 @@ Status: Success
         # Handle both HTTPS and SSH URLs
         if "github.com" in repo_url:
             # Extract owner/repo from URL
-            match = re.search(r'github\.com[:/]([^/]+)/([^/.]+)', repo_url)
+            match = GITHUB_REPO_RE.search(repo_url)
             if match:
                 return match.group(1), match.group(2)
         
@@ -810,6 +886,7 @@ Status: Success
         headers = {
             "Authorization": f"Bearer {self.github_token}",
             "Accept": "application/vnd.github+json",
+            "Content-Type": "application/json",
             "X-GitHub-Api-Version": "2022-11-28"
         }
         data = {
@@ -819,9 +896,12 @@ Status: Success
             "base": self.target_branch
         }
         
-        response = requests.post(api_url, json=data, headers=headers, timeout=30)
+        response = requests.post(api_url, data=orjson.dumps(data), headers=headers, timeout=30)
         response.raise_for_status()
         
+        # Open PR list for this repo is now stale
+        self._api_cache.pop(("GET", api_url))
+        
         pr_data = response.json()
         pr_url = pr_data['html_url']
         pr_number = pr_data['number']
@@ -842,23 +922,61 @@ Status: Success
         Returns:
             PR data if exists, None otherwise
         """
+        head = f"{owner}:{branch_name}"
+        
+        try:
+            prs = self._list_open_prs(owner, repo)
+        except Exception:
+            return None
+        
+        for pr in prs:
+            if (pr.get('head') or {}).get('label') == head:
+                return pr
+        return None
+    
+    def _list_open_prs(self, owner: str, repo: str) -> List[Dict[str, Any]]:
+        """
+        List open PRs for a repository.
+        
+        One paginated list call replaces a filtered query per branch; the
+        result is kept in the short-lived API cache.
+        
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            
+        Returns:
+            List of open PR data dicts
+        """
         api_url = f"https://api.github.com/repos/{owner}/{repo}/pulls"
+        key = ("GET", api_url)
+        cached = self._api_cache.get(key)
+        if cached is not None:
+            return cached
+        
         headers = {
             "Authorization": f"Bearer {self.github_token}",
             "Accept": "application/vnd.github+json"
         }
-        params = {
-            "head": f"{owner}:{branch_name}",
-            "state": "open"
-        }
         
-        try:
+        prs = []
+        page = 1
+        while True:
+            params = {
+                "state": "open",
+                "per_page": 100,
+                "page": page
+            }
             response = requests.get(api_url, headers=headers, params=params, timeout=30)
             response.raise_for_status()
-            prs = response.json()
-            return prs[0] if prs else None
-        except Exception:
-            return None
+            batch = response.json()
+            prs.extend(batch)
+            if len(batch) < 100:
+                break
+            page += 1
+        
+        self._api_cache.set(key, prs)
+        return prs
     
     def _format_acceptance_criteria(self, criteria: List[str]) -> str:
         """
@@ -879,40 +997,74 @@ Status: Success
         """
         Emit event to be posted in bundle.
         
+        Events are buffered in memory with an integer ts_ns (time.time_ns())
+        and sent in one bundle by _post_event_bundle(), which converts it to
+        an ISO timestamp; the buffer is flushed early if it reaches
+        EVENT_FLUSH_THRESHOLD. After a failed early flush, events are only
+        sent with the final bundle, so an unreachable control plane costs one
+        POST timeout rather than one per emitted event.
+        
         Args:
             event_type: Event type
             payload: Event payload
         """
-        event = {
-            'event_id': str(uuid.uuid4()),
+        self.events.append({
+            'event_id': uuid.uuid4().hex,
             'event_type': event_type,
-            'timestamp': datetime.utcnow().isoformat(),
-            'actor_id': f"worker-{self.attempt_id}",
+            'ts_ns': time.time_ns(),
+            'actor_id': self._actor_id,
             'payload': payload
-        }
-        self.events.append(event)
+        })
+        
+        if len(self.events) >= EVENT_FLUSH_THRESHOLD and not self._early_flush_disabled:
+            try:
+                self._post_event_bundle(partial=True)
+            except Exception as e:
+                # Keep events buffered; the final bundle will carry them
+                self._early_flush_disabled = True
+                print(f"⚠ Early event flush failed ({len(self.events)} events kept, "
+                      f"no further early flushes): {e}")
     
-    def _post_event_bundle(self):
-        """Post event bundle to control plane API."""
+    def _post_event_bundle(self, partial: bool = False):
+        """
+        Post event bundle to control plane API.
+        
+        Args:
+            partial: Early flush of buffered events only. Artifacts are held
+                for the final bundle and posted events are dropped from the
+                buffer.
+        """
         print("\nPosting event bundle to control plane...")
         
+        events = [_event_for_wire(event) for event in self.events]
+        artifacts = [] if partial else self.artifacts
+        bundle_id = f"bundle-{self.attempt_id}"
+        if partial:
+            bundle_id = f"{bundle_id}-{uuid.uuid4().hex[:8]}"
+        
         bundle = {
             'target': self.target_name,
-            'bundle_id': f"bundle-{self.attempt_id}",
-            'events': self.events,
-            'artifacts': self.artifacts
+            'bundle_id': bundle_id,
+            'events': events,
+            'artifacts': artifacts
         }
         
         response = requests.post(
             f"{self.control_plane_url}/v1/events/ingest",
-            json=bundle,
-            headers={'Authorization': f'Bearer {self.control_plane_token}'},
+            data=orjson.dumps(bundle, option=orjson.OPT_NON_STR_KEYS),
+            headers={
+                'Authorization': f'Bearer {self.control_plane_token}',
+                'Content-Type': 'application/json'
+            },
             timeout=30
         )
         
         response.raise_for_status()
         
-        print(f"✓ Posted {len(self.events)} events, {len(self.artifacts)} artifacts")
+        if partial:
+            self.events.clear()
+        
+        print(f"✓ Posted {len(events)} events, {len(artifacts)} artifacts")
 
 
 def main():
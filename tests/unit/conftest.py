@@ -12,6 +12,12 @@ os.environ["LEVIATHAN_CONTROL_PLANE_TOKEN"] = "test-token-12345"
 os.environ["LEVIATHAN_BACKEND"] = "ndjson"
 
 
+@pytest.fixture(autouse=True, scope="session")
+def isolated_cache_home(tmp_path_factory):
+    """Keep tool caches (e.g. the invariants JSON cache) out of the real ~/.cache."""
+    os.environ["XDG_CACHE_HOME"] = str(tmp_path_factory.mktemp("xdg-cache"))
+
+
 @pytest.fixture
 def auth_headers():
     """Provide authentication headers for control plane API tests."""
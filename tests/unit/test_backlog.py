@@ -0,0 +1,75 @@
+"""
+Unit tests for the agent-runner Backlog and its immutable Task records.
+"""
+import dataclasses
+import pytest
+import yaml
+
+from leviathan.backlog import Backlog
+
+
+@pytest.fixture
+def backlog_file(tmp_path):
+    """Write a two-task backlog; task-1 has an open PR."""
+    path = tmp_path / "agent_backlog.yaml"
+    path.write_text(yaml.safe_dump({
+        'version': 1,
+        'max_open_prs': 2,
+        'tasks': [
+            {
+                'id': 'task-1',
+                'title': 'First',
+                'scope': 'docs',
+                'priority': 'high',
+                'ready': True,
+                'allowed_paths': ['docs/a.md'],
+                'acceptance_criteria': [],
+                'estimated_size': 'small',
+                'status': 'pr_opened',
+                'branch_name': 'agent/task-1',
+            },
+            {
+                'id': 'task-2',
+                'title': 'Second',
+                'scope': 'docs',
+                'priority': 'low',
+                'ready': True,
+                'allowed_paths': ['docs/b.md'],
+                'acceptance_criteria': [],
+                'estimated_size': 'small',
+            },
+        ],
+    }))
+    return path
+
+
+class TestBacklog:
+    """Test Backlog status updates with frozen Task objects."""
+    
+    def test_task_is_frozen(self, backlog_file):
+        """Task fields should not be assignable in place."""
+        task = Backlog(backlog_file).get_task('task-2')
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            task.status = 'completed'
+    
+    def test_update_task_status_replaces_and_saves(self, backlog_file):
+        """Should swap in an updated Task and persist it."""
+        backlog = Backlog(backlog_file)
+        original = backlog.get_task('task-2')
+        
+        backlog.update_task_status('task-2', 'pr_opened', pr_number=7, branch_name='agent/task-2')
+        
+        updated = backlog.get_task('task-2')
+        assert (updated.status, updated.pr_number, updated.branch_name) == ('pr_opened', 7, 'agent/task-2')
+        assert original.status is None
+        assert Backlog(backlog_file).get_task('task-2') == updated
+    
+    def test_sync_pr_open_status_completes_closed_prs(self, backlog_file):
+        """Should mark pr_opened tasks whose branch is no longer open as completed."""
+        backlog = Backlog(backlog_file)
+        
+        backlog.sync_pr_open_status(set())
+        
+        assert backlog.get_task('task-1').status == 'completed'
+        assert Backlog(backlog_file).get_task('task-1').status == 'completed'
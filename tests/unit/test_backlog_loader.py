@@ -6,7 +6,7 @@ import tempfile
 import yaml
 from pathlib import Path
 
-from leviathan.backlog_loader import load_backlog_tasks, filter_ready_tasks
+from leviathan.backlog_loader import load_backlog_tasks, load_backlog_task, filter_ready_tasks
 
 
 class TestBacklogLoader:
@@ -287,3 +287,194 @@ class TestBacklogLoader:
         assert task['allowed_paths'] == ['leviathan/']
         assert task['acceptance_criteria'] == ['Tests pass']
         assert task['dependencies'] == []
+
+
+class TestBacklogParseCache:
+    """Test the (path, mtime, size)-keyed parse cache."""
+    
+    def test_unchanged_file_parsed_once(self, tmp_path, monkeypatch):
+        """Should reuse the parsed document while the file is unchanged."""
+        import leviathan.backlog_loader as backlog_loader
+        
+        backlog_file = tmp_path / "backlog.yaml"
+        backlog_file.write_text("tasks:\n  - id: task-001\n    title: First\n")
+        
+        parses = []
+        real_load = backlog_loader.yaml.load
+        monkeypatch.setattr(
+            backlog_loader.yaml, "load",
+            lambda stream, Loader: parses.append(1) or real_load(stream, Loader=Loader)
+        )
+        
+        first = load_backlog_tasks(backlog_file)
+        second = load_backlog_tasks(backlog_file)
+        
+        assert first == second
+        assert len(parses) == 1
+    
+    def test_modified_file_reparsed(self, tmp_path):
+        """Should reparse after the file changes."""
+        backlog_file = tmp_path / "backlog.yaml"
+        backlog_file.write_text("tasks:\n  - id: task-001\n")
+        assert [t['id'] for t in load_backlog_tasks(backlog_file)] == ['task-001']
+        
+        backlog_file.write_text("tasks:\n  - id: task-001\n  - id: task-002\n")
+        assert [t['id'] for t in load_backlog_tasks(backlog_file)] == ['task-001', 'task-002']
+    
+    def test_normalization_does_not_leak_into_cache(self, tmp_path):
+        """Mutating returned task dicts should not affect later loads."""
+        backlog_file = tmp_path / "backlog.yaml"
+        backlog_file.write_text("tasks:\n  - task_id: task-001\n")
+        
+        tasks = load_backlog_tasks(backlog_file)
+        tasks[0]['status'] = 'completed'
+        
+        reloaded = load_backlog_tasks(backlog_file)[0]
+        assert 'status' not in reloaded
+        assert reloaded['id'] == 'task-001'
+
+
+class TestLoadBacklogTask:
+    """Test single-task lookup by ID."""
+    
+    def test_repeat_lookup_served_from_cache(self, tmp_path, monkeypatch):
+        """Should skip the read/parse on an unchanged file and hand out independent copies."""
+        import leviathan.backlog_loader as backlog_loader
+        
+        backlog_file = tmp_path / "backlog.yaml"
+        backlog_file.write_text("tasks:\n  - id: task-001\n    title: First\n")
+        
+        parses = []
+        real_load = backlog_loader.yaml.load
+        monkeypatch.setattr(
+            backlog_loader.yaml, "load",
+            lambda stream, Loader: parses.append(1) or real_load(stream, Loader=Loader)
+        )
+        
+        first = load_backlog_task(backlog_file, 'task-001')
+        first['status'] = 'completed'
+        second = load_backlog_task(backlog_file, 'task-001')
+        
+        assert second == {'id': 'task-001', 'title': 'First'}
+        assert len(parses) == 1
+    
+    def test_finds_task_in_dict_format(self, tmp_path):
+        """Should return the matching task from a yaml.dump'd backlog (id not first key)."""
+        backlog_file = tmp_path / "backlog.yaml"
+        backlog_data = {
+            'version': 1,
+            'tasks': [
+                {'id': 'task-001', 'title': 'First', 'allowed_paths': ['a.py']},
+                {'id': 'task-002', 'title': 'Second', 'allowed_paths': ['b.py']},
+                {'id': 'task-003', 'title': 'Third', 'allowed_paths': []}
+            ]
+        }
+        with open(backlog_file, 'w') as f:
+            yaml.dump(backlog_data, f)
+        
+        task = load_backlog_task(backlog_file, 'task-002')
+        
+        assert task == {'id': 'task-002', 'title': 'Second', 'allowed_paths': ['b.py']}
+    
+    def test_finds_task_in_list_format(self, tmp_path):
+        """Should return the matching task from a top-level list backlog."""
+        backlog_file = tmp_path / "backlog.yaml"
+        backlog_file.write_text(
+            "- id: task-001\n"
+            "  title: First\n"
+            "- id: task-002\n"
+            "  title: Second\n"
+            "  acceptance_criteria:\n"
+            "    - Works\n"
+        )
+        
+        task = load_backlog_task(backlog_file, 'task-002')
+        
+        assert task == {'id': 'task-002', 'title': 'Second', 'acceptance_criteria': ['Works']}
+    
+    def test_task_id_normalized_to_id(self, tmp_path):
+        """Should normalize 'task_id' to 'id' like load_backlog_tasks."""
+        backlog_file = tmp_path / "backlog.yaml"
+        backlog_file.write_text("tasks:\n  - task_id: task-001\n    title: Old format\n")
+        
+        task = load_backlog_task(backlog_file, 'task-001')
+        
+        assert task['id'] == 'task-001'
+        assert task['task_id'] == 'task-001'
+    
+    def test_missing_task_returns_none(self, tmp_path):
+        """Should return None when no task has the ID."""
+        backlog_file = tmp_path / "backlog.yaml"
+        backlog_file.write_text("tasks:\n  - id: task-001\n    title: Only\n")
+        
+        assert load_backlog_task(backlog_file, 'task-999') is None
+    
+    def test_falls_back_to_full_parse(self, tmp_path):
+        """Should fall back to full parse when the ID is not on its own line."""
+        backlog_file = tmp_path / "backlog.yaml"
+        backlog_file.write_text("tasks: [{id: task-001, title: Flow style}]\n")
+        
+        task = load_backlog_task(backlog_file, 'task-001')
+        
+        assert task['title'] == 'Flow style'
+    
+    def test_fallback_indexes_file_once(self, tmp_path, monkeypatch):
+        """Should build one id index per file and serve other fallback IDs from it."""
+        import leviathan.backlog_loader as backlog_loader
+        
+        backlog_file = tmp_path / "backlog.yaml"
+        backlog_file.write_text(
+            "tasks: [{id: task-001, title: A}, {task_id: task-002, title: B}, {id: task-001, title: Dup}]\n"
+        )
+        
+        calls = []
+        real_load = backlog_loader.load_backlog_tasks
+        monkeypatch.setattr(
+            backlog_loader, "load_backlog_tasks",
+            lambda path: calls.append(path) or real_load(path)
+        )
+        
+        assert load_backlog_task(backlog_file, 'task-001')['title'] == 'A'
+        assert load_backlog_task(backlog_file, 'task-002')['title'] == 'B'
+        assert load_backlog_task(backlog_file, 'task-003') is None
+        assert len(calls) == 1
+    
+    def test_duplicate_id_uses_full_parse(self, tmp_path, monkeypatch):
+        """Should resolve a duplicated ID through the full parse (first task wins)."""
+        import leviathan.backlog_loader as backlog_loader
+        
+        backlog_file = tmp_path / "backlog.yaml"
+        backlog_file.write_text(
+            "tasks:\n"
+            "  - id: task-001  # original\n"
+            "    title: A\n"
+            "  - id: task-002\n"
+            "    title: B\n"
+            "  - id: task-001\n"
+            "    title: Dup\n"
+        )
+        
+        calls = []
+        real_load = backlog_loader.load_backlog_tasks
+        monkeypatch.setattr(
+            backlog_loader, "load_backlog_tasks",
+            lambda path: calls.append(path) or real_load(path)
+        )
+        
+        assert load_backlog_task(backlog_file, 'task-001')['title'] == 'A'
+        assert len(calls) == 1
+    
+    def test_json_backlog(self, tmp_path):
+        """Should decode a .json backlog and normalize task_id like YAML."""
+        backlog_file = tmp_path / "backlog.json"
+        backlog_file.write_text('{"tasks": [{"id": "task-001"}, {"task_id": "task-002", "title": "JSON"}]}')
+        
+        assert load_backlog_task(backlog_file, 'task-002') == {
+            'task_id': 'task-002', 'title': 'JSON', 'id': 'task-002'
+        }
+        assert [t['id'] for t in load_backlog_tasks(backlog_file)] == ['task-001', 'task-002']
+    
+    def test_missing_backlog_file(self, tmp_path):
+        """Should raise FileNotFoundError for missing file."""
+        with pytest.raises(FileNotFoundError):
+            load_backlog_task(tmp_path / "nonexistent.yaml", 'task-001')
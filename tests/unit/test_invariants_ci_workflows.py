@@ -0,0 +1,106 @@
+"""
+Unit tests for CI workflow invariants.
+
+Tests the forbidden ':latest' image tag scan.
+"""
+import pytest
+from unittest.mock import patch
+
+from tools.invariants_check import InvariantsChecker
+
+
+CI_WORKFLOW = """name: CI
+on: [push]
+jobs:
+  test:
+    runs-on: ubuntu-latest
+    steps:
+      - run: python3 tools/invariants_check.py
+      - run: python3 -m pytest tests/unit
+"""
+
+
+@pytest.fixture
+def repo_root(tmp_path):
+    """Minimal repo with a passing ci.yml."""
+    (tmp_path / "ops").mkdir()
+    (tmp_path / "ops" / "invariants.yaml").write_text("kubernetes: {}\nci: {}\n")
+    workflows_dir = tmp_path / ".github" / "workflows"
+    workflows_dir.mkdir(parents=True)
+    (workflows_dir / "ci.yml").write_text(CI_WORKFLOW)
+    return tmp_path
+
+
+class TestCiWorkflowInvariants:
+    """Test CI workflow invariants."""
+    
+    def test_pinned_images_pass(self, repo_root):
+        """Images with explicit tags should pass."""
+        (repo_root / ".github" / "workflows" / "deploy.yml").write_text(
+            "jobs:\n  build:\n    container:\n      image: python:3.10\n"
+        )
+        
+        checker = InvariantsChecker(repo_root)
+        checker.check_ci_workflows()
+        
+        assert checker.failures == []
+    
+    def test_latest_image_lines_fail(self, repo_root):
+        """Every line pairing an image key with :latest should be reported."""
+        (repo_root / ".github" / "workflows" / "deploy.yml").write_text(
+            "jobs:\n"
+            "  build:\n"
+            "    services:\n"
+            "      - image: redis:latest\n"
+            "      - image: postgres:15\n"
+            "    container:\n"
+            "      image: leviathan:latest  \n"
+            "    runs-on: ubuntu-latest\n"
+        )
+        
+        checker = InvariantsChecker(repo_root)
+        checker.check_ci_workflows()
+        
+        assert checker.failures == [
+            "Workflow deploy.yml contains forbidden ':latest' image tag: - image: redis:latest",
+            "Workflow deploy.yml contains forbidden ':latest' image tag: image: leviathan:latest",
+        ]
+    
+    def test_ci_without_markers_fails_without_parsing(self, repo_root):
+        """A ci.yml naming neither command should fail both checks without a YAML parse."""
+        (repo_root / ".github" / "workflows" / "ci.yml").write_text(
+            "jobs:\n  build:\n    steps:\n      - run: make\n"
+        )
+        checker = InvariantsChecker(repo_root)
+        
+        with patch.object(InvariantsChecker, '_load_yaml_doc') as mock_load:
+            checker.check_ci_workflows()
+        
+        mock_load.assert_not_called()
+        assert checker.failures == [
+            "CI workflow must run invariants_check.py",
+            "CI workflow must run pytest",
+        ]
+
+
+class TestRequirementsInvariants:
+    """Test required dev dependency invariants."""
+    
+    def test_required_dependencies_matched_by_name(self, repo_root):
+        """Dependencies should match project names, not substrings of other names."""
+        (repo_root / "ops" / "invariants.yaml").write_text(
+            "kubernetes: {}\nci:\n  required_dependencies: [pytest, PyYAML, httpx, ruamel_yaml]\n"
+        )
+        (repo_root / "requirements-dev.txt").write_text(
+            "# Development and testing dependencies\n"
+            "-r requirements.txt\n"
+            "pytest-asyncio>=0.21.0\n"
+            "pyyaml>=6.0.0  # parser\n"
+            "httpx[http2]==0.25.0\n"
+            "ruamel.yaml; python_version >= '3.10'\n"
+        )
+        
+        checker = InvariantsChecker(repo_root)
+        checker.check_requirements()
+        
+        assert checker.failures == ["requirements-dev.txt missing required dependency: pytest"]
@@ -6,6 +6,7 @@ Tests that the invariants checker correctly validates autonomy ConfigMap mountin
 import pytest
 import yaml
 from pathlib import Path
+from unittest.mock import patch
 
 from tools.invariants_check import InvariantsChecker
 
@@ -118,3 +119,70 @@ class TestControlPlaneAutonomyInvariants:
         # Should have no failures related to autonomy
         autonomy_failures = [f for f in checker.failures if 'autonomy' in f.lower()]
         assert len(autonomy_failures) == 0, f"Should have no autonomy-related failures, got: {autonomy_failures}"
+    
+    def test_control_plane_manifest_parsed_once(self):
+        """Checks sharing control-plane.yaml should reuse one parsed document list."""
+        repo_root = Path(__file__).parent.parent.parent
+        checker = InvariantsChecker(repo_root)
+        control_plane_yaml = repo_root / "ops" / "k8s" / "control-plane.yaml"
+        
+        checker.check_k8s_control_plane()
+        docs = checker._yaml_cache[control_plane_yaml]
+        checker.check_control_plane_autonomy_mount()
+        
+        assert checker._load_yaml_docs(control_plane_yaml) is docs
+    
+    def test_run_all_checks_writes_report_once(self):
+        """The full report should reach stdout in a single write."""
+        repo_root = Path(__file__).parent.parent.parent
+        checker = InvariantsChecker(repo_root)
+        
+        with patch('sys.stdout') as mock_stdout:
+            assert checker.run_all_checks() is True
+        
+        mock_stdout.write.assert_called_once()
+        report = mock_stdout.write.call_args[0][0]
+        assert report.startswith("Leviathan Invariants Gate\n")
+        assert "\n=== Checking Kustomize Structure ===\n✓ Kustomize structure valid\n" in report
+        assert report.endswith("✅ SUCCESS: All invariants validated\n")
+    
+    def test_control_plane_rules_report_mismatches(self, tmp_path):
+        """Rule-table checks should report each mismatched control plane field."""
+        (tmp_path / "ops" / "k8s").mkdir(parents=True)
+        (tmp_path / "ops" / "invariants.yaml").write_text(yaml.safe_dump({
+            'kubernetes': {'control_plane': {
+                'container_name': 'control-plane',
+                'image_name': 'leviathan-control-plane',
+                'labels': {'app': 'leviathan-control-plane'},
+                'selectors': {'app': 'leviathan-control-plane'},
+                'service_name': 'leviathan-control-plane',
+                'port': 8000,
+            }},
+        }))
+        (tmp_path / "ops" / "k8s" / "control-plane.yaml").write_text(yaml.safe_dump_all([
+            {
+                'kind': 'Deployment',
+                'metadata': {'labels': {'app': 'leviathan-control-plane'}},
+                'spec': {
+                    'selector': {'matchLabels': {'app': 'leviathan-control-plane'}},
+                    'template': {'spec': {'containers': [
+                        {'name': 'api', 'image': 'leviathan-control-plane:latest'},
+                    ]}},
+                },
+            },
+            {
+                'kind': 'Service',
+                'metadata': {'name': 'leviathan-control-plane'},
+                'spec': {'ports': [{'port': 80}]},
+            },
+        ]))
+        
+        checker = InvariantsChecker(tmp_path)
+        checker.check_k8s_control_plane()
+        
+        assert checker.failures == [
+            "Control plane container name must be 'control-plane', got 'api'",
+            "Control plane image uses forbidden ':latest' tag: leviathan-control-plane:latest",
+            "Control plane service selector 'app' must be 'leviathan-control-plane', got 'None'",
+            "Control plane service port must be 8000, got 80",
+        ]
@@ -122,3 +122,23 @@ See [13_HANDOVER_START_HERE.md](13_HANDOVER_START_HERE.md)
             
             # Should have no failures
             assert len(checker.failures) == 0
+    
+    def test_run_check_buffers_output_and_returns_failures(self, capsys):
+        """A check run through _run_check should return its failures and buffer its report."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            repo_root = Path(tmpdir)
+            
+            # Create minimal structure with no docs
+            (repo_root / "docs").mkdir()
+            ops_dir = repo_root / "ops"
+            ops_dir.mkdir()
+            (ops_dir / "invariants.yaml").write_text("kubernetes: {}\n")
+            
+            checker = InvariantsChecker(repo_root)
+            failures = checker._run_check('check_documentation_invariants')
+            
+            assert failures == checker.failures
+            assert capsys.readouterr().out == ""
+            assert checker._out[0] == "\n=== Checking Documentation Invariants ===\n"
+            assert any('13_HANDOVER_START_HERE.md' in failure for failure in failures)
+            assert checker._out[1:] == ["".join(f"FAIL: {f}\n" for f in failures)]
@@ -206,3 +206,60 @@ class TestK8sJobInvariants:
         
         # Should have no failures
         assert len(checker.failures) == 0
+    
+    def test_scripts_reference_in_command_fails(self, tmp_path):
+        """Container commands/args invoking scripts/ should fail with the module hint."""
+        (tmp_path / "ops").mkdir()
+        (tmp_path / "ops" / "invariants.yaml").write_text("kubernetes: {}\n")
+        k8s_dir = tmp_path / "ops" / "k8s"
+        k8s_dir.mkdir()
+        (k8s_dir / "runner.yaml").write_text(yaml.dump({
+            'apiVersion': 'v1',
+            'kind': 'Pod',
+            'metadata': {'name': 'runner', 'namespace': 'leviathan'},
+            'spec': {
+                'containers': [{
+                    'name': 'runner',
+                    'image': 'leviathan-worker:local',
+                    'command': ['python3', 'scripts/run.py'],
+                    'args': ['--config', 7, 'scripts/config.yaml'],
+                }]
+            }
+        }))
+        
+        checker = InvariantsChecker(tmp_path)
+        checker.check_k8s_packaging()
+        
+        assert checker.failures == [
+            "K8s manifest runner.yaml references scripts/ in command: scripts/run.py. "
+            "Use 'python3 -m leviathan.module' instead.",
+            "K8s manifest runner.yaml references scripts/ in args: scripts/config.yaml. "
+            "Use 'python3 -m leviathan.module' instead.",
+        ]
+    
+    def test_worker_job_template_containers_read_without_kind(self, tmp_path):
+        """The job template's containers should be checked even if its kind is missing."""
+        (tmp_path / "ops").mkdir()
+        (tmp_path / "ops" / "invariants.yaml").write_text(yaml.dump({
+            'kubernetes': {'worker': {
+                'container_name': 'worker',
+                'image_name': 'leviathan-worker',
+                'job_labels': {'app': 'leviathan'},
+            }},
+            'secrets': {'worker': {'required_env_vars': ['TASK_ID']}},
+        }))
+        k8s_dir = tmp_path / "ops" / "k8s"
+        k8s_dir.mkdir()
+        (k8s_dir / "job-template.yaml").write_text(yaml.dump({
+            'metadata': {'labels': {'app': 'leviathan'}},
+            'spec': {'template': {'spec': {
+                'containers': [{'name': 'runner', 'image': 'leviathan-worker:local'}]
+            }}},
+        }))
+        
+        checker = InvariantsChecker(tmp_path)
+        checker.check_k8s_worker_job()
+        
+        assert "Worker container not found in job template" not in checker.failures
+        assert "Worker job template missing required env var: TASK_ID" in checker.failures
+        assert any("'runner'" in f for f in checker.failures)
@@ -0,0 +1,149 @@
+"""
+Unit tests for loading ops/invariants.yaml into the invariants checker.
+"""
+import datetime
+import json
+import pytest
+from unittest.mock import patch
+
+from tools.invariants_check import InvariantsChecker, _load_invariants_file
+
+
+@pytest.fixture
+def repo_root(tmp_path):
+    """Minimal repo with an invariants.yaml."""
+    (tmp_path / "ops").mkdir()
+    (tmp_path / "ops" / "invariants.yaml").write_text("kubernetes:\n  namespace: leviathan\n")
+    return tmp_path
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    """Point the cross-run invariants cache at a temp dir and start from a cold process cache."""
+    cache_home = tmp_path / "xdg-cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    _load_invariants_file.cache_clear()
+    return cache_home
+
+
+class TestInvariantsLoading:
+    """Test invariants.yaml parsing and its caches."""
+    
+    def test_unchanged_invariants_parsed_once(self, repo_root):
+        """A second checker in the same process should reuse the in-process parse."""
+        cold = InvariantsChecker(repo_root)
+        
+        with patch('tools.invariants_check.yaml.load') as mock_load:
+            warm = InvariantsChecker(repo_root)
+        
+        mock_load.assert_not_called()
+        assert warm.invariants is cold.invariants
+    
+    def test_warm_start_skips_yaml_parse(self, repo_root):
+        """A new process (cold lru_cache) should load unchanged invariants from the disk cache."""
+        cold = InvariantsChecker(repo_root)
+        _load_invariants_file.cache_clear()
+        
+        with patch('tools.invariants_check.yaml.load') as mock_load:
+            warm = InvariantsChecker(repo_root)
+        
+        mock_load.assert_not_called()
+        assert warm.invariants == cold.invariants == {'kubernetes': {'namespace': 'leviathan'}}
+    
+    def test_parse_cached_as_json_outside_repo(self, repo_root, cache_home):
+        """The cross-run cache should be a JSON file under $XDG_CACHE_HOME/leviathan."""
+        InvariantsChecker(repo_root)
+        
+        [cache_file] = (cache_home / "leviathan").glob("invariants-*.json")
+        assert json.loads(cache_file.read_text()) == {'kubernetes': {'namespace': 'leviathan'}}
+        assert not (repo_root / ".cache").exists()
+    
+    def test_corrupt_cache_entry_is_a_miss(self, repo_root, cache_home):
+        """An unreadable cache entry should be ignored and replaced by a fresh parse."""
+        InvariantsChecker(repo_root)
+        [cache_file] = (cache_home / "leviathan").glob("invariants-*.json")
+        cache_file.write_text('{"kubernetes": ')
+        _load_invariants_file.cache_clear()
+        
+        checker = InvariantsChecker(repo_root)
+        
+        assert checker.invariants == {'kubernetes': {'namespace': 'leviathan'}}
+        assert json.loads(cache_file.read_text()) == {'kubernetes': {'namespace': 'leviathan'}}
+    
+    def test_non_json_invariants_not_cached(self, repo_root, cache_home):
+        """Content that JSON cannot round-trip (e.g. dates) should be parsed every run."""
+        (repo_root / "ops" / "invariants.yaml").write_text("released: 2024-01-31\n")
+        
+        checker = InvariantsChecker(repo_root)
+        
+        assert checker.invariants['released'] == datetime.date(2024, 1, 31)
+        assert not (cache_home / "leviathan").exists()
+    
+    def test_invariants_shared_and_read_only(self, repo_root):
+        """Checkers for the same unchanged file should share one frozen invariants mapping."""
+        first = InvariantsChecker(repo_root)
+        second = InvariantsChecker(repo_root)
+        
+        assert first.invariants is second.invariants
+        with pytest.raises(TypeError):
+            first.invariants['kubernetes'] = {}
+    
+    def test_nested_invariants_read_only(self, repo_root):
+        """Nested sections and lists of the shared invariants should not be mutable either."""
+        (repo_root / "ops" / "invariants.yaml").write_text(
+            "kubernetes:\n  namespace: leviathan\nci:\n  required_dependencies: [pyyaml]\n"
+        )
+        checker = InvariantsChecker(repo_root)
+        
+        with pytest.raises(TypeError):
+            checker.invariants['kubernetes']['namespace'] = 'other'
+        with pytest.raises(AttributeError):
+            checker.invariants['ci']['required_dependencies'].append('requests')
+        assert checker.invariants['ci']['required_dependencies'] == ('pyyaml',)
+    
+    def test_changed_invariants_reparsed(self, repo_root):
+        """Editing invariants.yaml should miss the cache and parse the new content."""
+        InvariantsChecker(repo_root)
+        (repo_root / "ops" / "invariants.yaml").write_text("kubernetes:\n  namespace: other\n")
+        
+        checker = InvariantsChecker(repo_root)
+        
+        assert checker.invariants['kubernetes']['namespace'] == 'other'
+    
+    def test_fast_fail_stops_after_first_failing_check(self, repo_root, capsys):
+        """With fast_fail, checks after the first failing one should not run."""
+        checker = InvariantsChecker(repo_root, fast_fail=True)
+        
+        assert checker.run_all_checks() is False
+        
+        # No ops/k8s/control-plane.yaml, so the first check fails and ends the run
+        assert checker.failures == [
+            f"Control plane manifest not found: {repo_root / 'ops' / 'k8s' / 'control-plane.yaml'}"
+        ]
+        assert "Checking Worker Job Template" not in capsys.readouterr().out
+    
+    def test_section_success_ignores_earlier_failures(self, repo_root):
+        """A check's ✓ line should depend only on failures it added itself."""
+        checker = InvariantsChecker(repo_root)
+        checker.check_k8s_control_plane()
+        checker.check_failover_documentation()
+        
+        assert len(checker.failures) == 1
+        assert checker._out[-2:] == [
+            "\n=== Checking Failover Documentation ===\n",
+            "✓ Failover documentation valid (no invariants configured)\n",
+        ]
+        assert "✓ Control plane manifests valid\n" not in checker._out
+    
+    def test_crashing_check_reported_as_failure(self, repo_root, capsys):
+        """A check that raises should fail the run without losing the other checks' report."""
+        checker = InvariantsChecker(repo_root)
+        
+        with patch.object(InvariantsChecker, 'check_k8s_control_plane', side_effect=KeyError('secrets')):
+            assert checker.run_all_checks() is False
+        
+        out = capsys.readouterr().out
+        assert "check_k8s_control_plane crashed: 'secrets'" in checker.failures
+        assert "FAIL: check_k8s_control_plane crashed: 'secrets'" in out
+        assert "=== Checking Worker Job Template ===" in out
+        assert "invariant(s) violated" in out
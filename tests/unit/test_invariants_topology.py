@@ -0,0 +1,69 @@
+"""
+Unit tests for topology and failover invariants.
+
+Tests source scans against configured artifact names, endpoints and backends.
+"""
+import pytest
+
+from tools.invariants_check import InvariantsChecker
+
+
+@pytest.fixture
+def repo_root(tmp_path):
+    """Minimal repo with no topology/failover sources."""
+    (tmp_path / "ops").mkdir()
+    (tmp_path / "ops" / "invariants.yaml").write_text("kubernetes: {}\n")
+    return tmp_path
+
+
+class TestTopologyInvariants:
+    """Test topology and failover invariants."""
+    
+    @pytest.mark.parametrize("check", [
+        'check_topology_artifacts',
+        'check_topology_api_endpoints',
+        'check_failover_documentation',
+        'check_failover_backends',
+    ])
+    def test_unconfigured_invariants_skip_sources(self, repo_root, check):
+        """With nothing configured, checks should pass without needing the source files."""
+        checker = InvariantsChecker(repo_root)
+        getattr(checker, check)()
+        
+        assert checker.failures == []
+        assert checker._mmap_cache == {}
+    
+    def test_configured_backend_requires_source(self, repo_root):
+        """A configured backend should still fail when its source file is missing."""
+        (repo_root / "ops" / "invariants.yaml").write_text(
+            "kubernetes: {}\nfailover:\n  backends:\n    event_store: [ndjson]\n"
+        )
+        
+        checker = InvariantsChecker(repo_root)
+        checker.check_failover_backends()
+        
+        assert checker.failures == ["Event store file not found"]
+    
+    def test_missing_artifacts_and_endpoints_reported(self, repo_root):
+        """Only names absent from the sources should fail, including nested needles."""
+        (repo_root / "ops" / "invariants.yaml").write_text(
+            "kubernetes: {}\n"
+            "topology:\n"
+            "  artifact_names: [topo_deps.json, deps.json, topo_areas.json]\n"
+            "  api_endpoints: [/v1/topology/summary, /v1/topology/areas]\n"
+        )
+        indexer = repo_root / "leviathan" / "topology" / "indexer.py"
+        indexer.parent.mkdir(parents=True)
+        indexer.write_text('OUT = "topo_deps.json"\n')
+        api = repo_root / "leviathan" / "control_plane" / "api.py"
+        api.parent.mkdir(parents=True)
+        api.write_text('@app.get("/v1/topology/summary")\ndef summary(): ...\n')
+        
+        checker = InvariantsChecker(repo_root)
+        checker.check_topology_artifacts()
+        checker.check_topology_api_endpoints()
+        
+        assert checker.failures == [
+            "Topology artifact 'topo_areas.json' not found in indexer code",
+            "Topology API endpoint '/v1/topology/areas' not found in control plane",
+        ]
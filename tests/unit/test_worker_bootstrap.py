@@ -2,13 +2,92 @@
 Unit tests for worker bootstrap execution.
 """
 import pytest
-import tempfile
-from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+import orjson
+import subprocess
+from unittest.mock import Mock
 import yaml
 
 from leviathan.executor.worker import Worker
-from leviathan.backlog import Task
+
+
+_SHA = subprocess.CompletedProcess(args=[], returncode=0, stdout='abc123def456')
+_OK = subprocess.CompletedProcess(args=[], returncode=0, stdout='')
+
+# (program, subcommand) -> canned result; None marks a forbidden command
+_DISPATCH = {
+    ('git', 'rev-parse'): _SHA,
+    ('git', 'clone'): _OK,  # Don't actually clone, files already created
+    ('git', 'push'): None,
+}
+
+
+def _fake_run(args, **kwargs):
+    """Stand-in for subprocess.run backed by _DISPATCH."""
+    key = (args[0], args[1]) if len(args) > 1 else (args[0],)
+    result = _DISPATCH.get(key, _OK)
+    if result is None:
+        pytest.fail("Bootstrap task should not push to git")
+    return result
+
+
+class _FailModelClient:
+    """ModelClient stand-in that fails the test if bootstrap instantiates it."""
+    
+    def __init__(self, *args, **kwargs):
+        pytest.fail("Bootstrap tasks must not instantiate ModelClient")
+
+
+class _OkResponse:
+    """Minimal successful HTTP response."""
+    
+    status_code = 200
+    
+    def raise_for_status(self):
+        pass
+
+
+_POST_OK = _OkResponse()
+
+
+class RecordingPost:
+    """requests.post stand-in that keeps only the last JSON payload and the URLs."""
+    
+    def __init__(self):
+        self.last_json = None
+        self.calls = 0
+        self.urls = []
+    
+    def __call__(self, url, json=None, data=None, headers=None, **kwargs):
+        self.calls += 1
+        self.last_json = json if json is not None else orjson.loads(data)
+        self.urls.append(url)
+        return _POST_OK
+
+
+@pytest.fixture(autouse=True)
+def patched_worker_deps(monkeypatch):
+    """Patch worker subprocess/HTTP/model dependencies once per test."""
+    post = RecordingPost()
+    monkeypatch.setattr('leviathan.executor.worker.subprocess.run', _fake_run)
+    monkeypatch.setattr('leviathan.executor.worker.requests.post', post)
+    monkeypatch.setattr('leviathan.executor.worker.ModelClient', _FailModelClient)
+    return post
+
+
+@pytest.fixture
+def mock_artifact_store(monkeypatch):
+    """Replace ArtifactStore with an in-memory stub."""
+    mock_store_instance = Mock()
+    mock_store_instance.store.return_value = {
+        'sha256': 'test-sha256',
+        'storage_path': '/tmp/test',
+        'size_bytes': 100
+    }
+    monkeypatch.setattr(
+        'leviathan.executor.worker.ArtifactStore',
+        lambda *args, **kwargs: mock_store_instance
+    )
+    return mock_store_instance
 
 
 class TestWorkerBootstrapExecution:
@@ -27,17 +106,17 @@ class TestWorkerBootstrapExecution:
         monkeypatch.setenv("CONTROL_PLANE_TOKEN", "test-token")
         monkeypatch.setenv("GITHUB_TOKEN", "test-github-token")
         
-        # Mock workspace
+        # Workspace root handed to Worker(workspace_candidates=...)
         workspace = tmp_path / "workspace"
         workspace.mkdir()
-        monkeypatch.setattr("leviathan.executor.worker.Path", lambda x: workspace if x == "/workspace" else Path(x))
+        monkeypatch.delenv("LEVIATHAN_WORKSPACE_DIR", raising=False)
         
         return workspace
     
-    @patch('leviathan.executor.worker.subprocess.run')
-    @patch('leviathan.executor.worker.requests.post')
-    def test_bootstrap_task_uses_indexer_not_model(self, mock_post, mock_subprocess, mock_env, tmp_path):
+    def test_bootstrap_task_uses_indexer_not_model(self, patched_worker_deps, mock_env, tmp_path):
         """Bootstrap tasks should use indexer, not ModelClient."""
+        post = patched_worker_deps
+        
         # Create mock target repo with backlog
         target_dir = mock_env / "target"
         target_dir.mkdir(parents=True)
@@ -65,62 +144,36 @@ class TestWorkerBootstrapExecution:
         (target_dir / 'README.md').write_text('# Test Repo\n\nDescription')
         (target_dir / 'main.py').write_text('print("hello")')
         
-        # Mock git operations
-        def mock_run_side_effect(*args, **kwargs):
-            cmd = args[0]
-            if cmd[0] == 'git' and cmd[1] == 'clone':
-                # Don't actually clone, files already created
-                return Mock(returncode=0)
-            elif cmd[0] == 'git' and cmd[1] == 'rev-parse':
-                # Return mock commit SHA
-                return Mock(stdout='abc123def456', returncode=0)
-            return Mock(returncode=0)
-        
-        mock_subprocess.side_effect = mock_run_side_effect
-        
-        # Mock control plane response
-        mock_post.return_value = Mock(status_code=200)
-        
-        # Create worker and run
-        with patch('leviathan.executor.worker.ModelClient') as mock_model_client:
-            worker = Worker()
-            
-            # Override target_dir to use our mock
-            worker.target_dir = target_dir
-            
-            result = worker.run()
-            
-            # Assert ModelClient was never instantiated (no model calls for bootstrap)
-            mock_model_client.assert_not_called()
-            
-            # Assert success
-            assert result == 0
-            
-            # Assert events were posted
-            assert mock_post.called
-            call_args = mock_post.call_args
-            bundle = call_args[1]['json']
-            
-            # Debug: print all event types
-            event_types = [e['event_type'] for e in bundle['events']]
-            print(f"\nDEBUG: Event types in bundle: {event_types}")
-            print(f"DEBUG: Total events: {len(bundle['events'])}")
-            
-            # Check that bootstrap events are present
-            assert 'bootstrap.started' in event_types
-            assert 'bootstrap.completed' in event_types
-            assert 'repo.indexed' in event_types
-            assert 'file.discovered' in event_types
-            
-            # Check that artifacts were created
-            assert len(bundle['artifacts']) > 0
-            artifact_names = [a.get('name', '') for a in bundle['artifacts']]
-            assert 'repo_tree.txt' in artifact_names
-            assert 'repo_manifest.json' in artifact_names
+        # Create worker and run (ModelClient instantiation fails the test)
+        worker = Worker(workspace_candidates=[mock_env])
+        
+        # Override target_dir to use our mock
+        worker.target_dir = target_dir
+        
+        result = worker.run()
+        
+        # Assert success
+        assert result == 0
+        
+        # Assert events were posted
+        assert post.calls > 0
+        bundle = post.last_json
+        
+        event_types = {e['event_type'] for e in bundle['events']}
+        
+        # Check that bootstrap events are present
+        assert 'bootstrap.started' in event_types
+        assert 'bootstrap.completed' in event_types
+        assert 'repo.indexed' in event_types
+        assert 'file.discovered' in event_types
+        
+        # Check that artifacts were created
+        assert len(bundle['artifacts']) > 0
+        artifact_names = {a.get('name', '') for a in bundle['artifacts']}
+        assert 'repo_tree.txt' in artifact_names
+        assert 'repo_manifest.json' in artifact_names
     
-    @patch('leviathan.executor.worker.subprocess.run')
-    @patch('leviathan.executor.worker.requests.post')
-    def test_bootstrap_task_no_pr_created(self, mock_post, mock_subprocess, mock_env, tmp_path):
+    def test_bootstrap_task_no_pr_created(self, patched_worker_deps, mock_env, tmp_path):
         """Bootstrap tasks should not create PRs."""
         # Create mock target repo
         target_dir = mock_env / "target"
@@ -148,122 +201,33 @@ class TestWorkerBootstrapExecution:
         # Create test file
         (target_dir / 'README.md').write_text('# Test')
         
-        # Mock git operations
-        def mock_run_side_effect(*args, **kwargs):
-            cmd = args[0]
-            if cmd[0] == 'git' and cmd[1] == 'clone':
-                return Mock(returncode=0)
-            elif cmd[0] == 'git' and cmd[1] == 'rev-parse':
-                return Mock(stdout='abc123', returncode=0)
-            # If we see git push or any PR-related commands, fail the test
-            elif cmd[0] == 'git' and cmd[1] == 'push':
-                pytest.fail("Bootstrap task should not push to git")
-            return Mock(returncode=0)
-        
-        mock_subprocess.side_effect = mock_run_side_effect
-        mock_post.return_value = Mock(status_code=200)
-        
-        # Create worker and run
-        with patch('leviathan.executor.worker.requests.post') as mock_pr_post:
-            worker = Worker()
-            worker.target_dir = target_dir
-            
-            result = worker.run()
-            
-            # Assert success
-            assert result == 0
-            
-            # Check that no PR was created (no github.com API calls)
-            for call in mock_pr_post.call_args_list:
-                url = call[0][0] if call[0] else call[1].get('url', '')
-                assert 'api.github.com' not in url, "Bootstrap should not create PRs"
-    
-    @patch('leviathan.executor.worker.subprocess.run')
-    @patch('leviathan.executor.worker.requests.post')
-    @patch('leviathan.executor.worker.ArtifactStore')
-    def test_bootstrap_by_task_id_prefix(self, mock_artifact_store, mock_post, mock_subprocess, tmp_path, monkeypatch):
-        """Tasks with id starting with 'bootstrap-' should use bootstrap path."""
-        # Set environment with bootstrap- prefixed task ID
-        monkeypatch.setenv("TARGET_NAME", "test-target")
-        monkeypatch.setenv("TARGET_REPO_URL", "git@github.com:test/repo.git")
-        monkeypatch.setenv("TARGET_BRANCH", "main")
-        monkeypatch.setenv("TASK_ID", "bootstrap-radix-v1")  # Match the task in backlog
-        monkeypatch.setenv("ATTEMPT_ID", "attempt-bootstrap-456")
-        monkeypatch.setenv("CONTROL_PLANE_URL", "http://test-control-plane:8000")
-        monkeypatch.setenv("CONTROL_PLANE_TOKEN", "test-token")
-        monkeypatch.setenv("GITHUB_TOKEN", "test-github-token")
+        # Create worker and run (git push fails the test)
+        worker = Worker(workspace_candidates=[mock_env])
+        worker.target_dir = target_dir
         
-        # Create mock target repo
-        workspace = tmp_path / "workspace"
-        workspace.mkdir()
-        target_dir = workspace / "target"
-        target_dir.mkdir(parents=True)
+        result = worker.run()
         
-        leviathan_dir = target_dir / ".leviathan"
-        leviathan_dir.mkdir()
+        # Assert success
+        assert result == 0
         
-        # Create backlog with task that has bootstrap- prefix but different scope
-        backlog = {
-            'tasks': [{
-                'id': 'bootstrap-radix-v1',
-                'title': 'Bootstrap Radix',
-                'scope': 'indexing',  # Different scope, but id starts with bootstrap-
-                'priority': 'high',
-                'allowed_paths': [],
-                'acceptance_criteria': ['Repository indexed'],
-                'status': 'pending'
-            }]
-        }
-        
-        with open(leviathan_dir / 'backlog.yaml', 'w') as f:
-            yaml.dump(backlog, f)
-        
-        (target_dir / 'README.md').write_text('# Test')
-        
-        # Mock artifact store
-        mock_store_instance = Mock()
-        mock_store_instance.store.return_value = {
-            'sha256': 'test-sha256',
-            'storage_path': '/tmp/test',
-            'size_bytes': 100
-        }
-        mock_artifact_store.return_value = mock_store_instance
-        
-        # Mock git operations
-        mock_subprocess.side_effect = lambda *args, **kwargs: Mock(
-            stdout='abc123' if args[0][1] == 'rev-parse' else '',
-            returncode=0
-        )
-        mock_post.return_value = Mock(status_code=200)
-        
-        # Create worker and run
-        with patch('leviathan.executor.worker.ModelClient') as mock_model_client:
-            worker = Worker()
-            worker.workspace = workspace
-            worker.target_dir = target_dir
-            
-            result = worker.run()
-            
-            # Should use bootstrap path (no model calls)
-            mock_model_client.assert_not_called()
-            
-            # Check events include bootstrap types
-            call_args = mock_post.call_args
-            bundle = call_args[1]['json']
-            event_types = [e['event_type'] for e in bundle['events']]
-            assert 'bootstrap.started' in event_types
+        # Check that no PR was created (no github.com API calls)
+        for url in patched_worker_deps.urls:
+            assert 'api.github.com' not in url, "Bootstrap should not create PRs"
     
-    @patch('leviathan.executor.worker.subprocess.run')
-    @patch('leviathan.executor.worker.requests.post')
-    @patch('leviathan.executor.worker.ArtifactStore')
-    def test_bootstrap_by_scope(self, mock_artifact_store, mock_post, mock_subprocess, tmp_path, monkeypatch):
-        """Tasks with scope='bootstrap' should use bootstrap path."""
-        # Set environment with non-bootstrap task ID
+    @pytest.mark.parametrize("task_id,scope", [
+        ("bootstrap-radix-v1", "indexing"),  # id starts with bootstrap-, other scope
+        ("index-repo-v1", "bootstrap"),  # other id pattern, scope is bootstrap
+    ])
+    def test_bootstrap_detected(self, task_id, scope, patched_worker_deps, mock_artifact_store, tmp_path, monkeypatch):
+        """Tasks with a 'bootstrap-' id prefix or scope='bootstrap' should use bootstrap path."""
+        post = patched_worker_deps
+        
+        # Set environment with the task ID under test
         monkeypatch.setenv("TARGET_NAME", "test-target")
         monkeypatch.setenv("TARGET_REPO_URL", "git@github.com:test/repo.git")
         monkeypatch.setenv("TARGET_BRANCH", "main")
-        monkeypatch.setenv("TASK_ID", "index-repo-v1")  # Match the task in backlog
-        monkeypatch.setenv("ATTEMPT_ID", "attempt-index-789")
+        monkeypatch.setenv("TASK_ID", task_id)  # Match the task in backlog
+        monkeypatch.setenv("ATTEMPT_ID", f"attempt-{task_id}")
         monkeypatch.setenv("CONTROL_PLANE_URL", "http://test-control-plane:8000")
         monkeypatch.setenv("CONTROL_PLANE_TOKEN", "test-token")
         monkeypatch.setenv("GITHUB_TOKEN", "test-github-token")
@@ -277,12 +241,11 @@ class TestWorkerBootstrapExecution:
         leviathan_dir = target_dir / ".leviathan"
         leviathan_dir.mkdir()
         
-        # Create backlog with task that has scope=bootstrap
         backlog = {
             'tasks': [{
-                'id': 'index-repo-v1',  # Different id pattern
+                'id': task_id,
                 'title': 'Index repository',
-                'scope': 'bootstrap',  # But scope is bootstrap
+                'scope': scope,
                 'priority': 'high',
                 'allowed_paths': [],
                 'acceptance_criteria': ['Repository indexed'],
@@ -295,35 +258,18 @@ class TestWorkerBootstrapExecution:
         
         (target_dir / 'README.md').write_text('# Test')
         
-        # Mock artifact store
-        mock_store_instance = Mock()
-        mock_store_instance.store.return_value = {
-            'sha256': 'test-sha256',
-            'storage_path': '/tmp/test',
-            'size_bytes': 100
-        }
-        mock_artifact_store.return_value = mock_store_instance
-        
-        # Mock git operations
-        mock_subprocess.side_effect = lambda *args, **kwargs: Mock(
-            stdout='abc123' if args[0][1] == 'rev-parse' else '',
-            returncode=0
-        )
-        mock_post.return_value = Mock(status_code=200)
-        
-        # Create worker and run
-        with patch('leviathan.executor.worker.ModelClient') as mock_model_client:
-            worker = Worker()
-            worker.workspace = workspace
-            worker.target_dir = target_dir
-            
-            result = worker.run()
-            
-            # Should use bootstrap path (no model calls)
-            mock_model_client.assert_not_called()
-            
-            # Check events include bootstrap types
-            call_args = mock_post.call_args
-            bundle = call_args[1]['json']
-            event_types = [e['event_type'] for e in bundle['events']]
-            assert 'bootstrap.completed' in event_types
+        # Create worker and run (should use bootstrap path, no model calls)
+        monkeypatch.delenv("LEVIATHAN_WORKSPACE_DIR", raising=False)
+        worker = Worker(workspace_candidates=[workspace])
+        worker.workspace = workspace
+        worker.target_dir = target_dir
+        
+        result = worker.run()
+        
+        assert result == 0
+        
+        # Check events include bootstrap types
+        bundle = post.last_json
+        event_types = {e['event_type'] for e in bundle['events']}
+        assert 'bootstrap.started' in event_types
+        assert 'bootstrap.completed' in event_types
@@ -2,13 +2,25 @@
 Unit tests for worker event bundle generation.
 """
 import pytest
-import os
-import tempfile
-import shutil
+import orjson
+from collections import deque
 from unittest.mock import Mock, patch, MagicMock
-from pathlib import Path
 
-from leviathan.executor.worker import Worker, WorkerError
+from leviathan.executor.worker import Worker, WorkerError, _event_for_wire
+
+
+_EVENT_KEYS = frozenset({'event_id', 'event_type', 'timestamp', 'actor_id', 'payload'})
+_ART_KEYS = frozenset({'sha256', 'kind', 'uri', 'size'})
+
+
+def assert_event_shape(event):
+    """Assert an event carries all control plane event fields."""
+    assert _EVENT_KEYS <= event.keys(), f"missing event keys: {_EVENT_KEYS - event.keys()}"
+
+
+def assert_artifact_shape(artifact):
+    """Assert an artifact reference carries all required fields."""
+    assert _ART_KEYS <= artifact.keys(), f"missing artifact keys: {_ART_KEYS - artifact.keys()}"
 
 
 def create_mock_worker(temp_dir):
@@ -22,7 +34,7 @@ def create_mock_worker(temp_dir):
     worker.control_plane_url = "http://test-api:8000"
     worker.control_plane_token = "test-token"
     worker.workspace = temp_dir
-    worker.events = []
+    worker.events = deque()
     worker.artifacts = []
     return worker
 
@@ -30,33 +42,25 @@ def create_mock_worker(temp_dir):
 class TestWorkerEventBundle:
     """Test worker event bundle generation."""
     
-    def setup_method(self):
-        """Set up test environment."""
-        # Create temp workspace
-        self.temp_dir = Path(tempfile.mkdtemp())
-        
-        # Set required env vars
-        os.environ["TARGET_NAME"] = "test-target"
-        os.environ["TARGET_REPO_URL"] = "git@github.com:test/repo.git"
-        os.environ["TARGET_BRANCH"] = "main"
-        os.environ["TASK_ID"] = "task-001"
-        os.environ["ATTEMPT_ID"] = "attempt-abc123"
-        os.environ["CONTROL_PLANE_URL"] = "http://test-api:8000"
-        os.environ["CONTROL_PLANE_TOKEN"] = "test-token"
+    @pytest.fixture(autouse=True)
+    def worker_env(self, monkeypatch):
+        """Set required env vars (restored by monkeypatch)."""
+        monkeypatch.setenv("TARGET_NAME", "test-target")
+        monkeypatch.setenv("TARGET_REPO_URL", "git@github.com:test/repo.git")
+        monkeypatch.setenv("TARGET_BRANCH", "main")
+        monkeypatch.setenv("TASK_ID", "task-001")
+        monkeypatch.setenv("ATTEMPT_ID", "attempt-abc123")
+        monkeypatch.setenv("CONTROL_PLANE_URL", "http://test-api:8000")
+        monkeypatch.setenv("CONTROL_PLANE_TOKEN", "test-token")
     
-    def teardown_method(self):
-        """Clean up environment."""
-        for key in ["TARGET_NAME", "TARGET_REPO_URL", "TARGET_BRANCH", 
-                    "TASK_ID", "ATTEMPT_ID", "CONTROL_PLANE_URL", "CONTROL_PLANE_TOKEN"]:
-            os.environ.pop(key, None)
-        
-        # Clean up temp directory
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
+    @pytest.fixture
+    def temp_dir(self, tmp_path):
+        """Temp workspace (cleaned up by pytest)."""
+        return tmp_path
     
-    def test_worker_initialization(self):
+    def test_worker_initialization(self, temp_dir):
         """Worker should initialize from environment variables."""
-        worker = create_mock_worker(self.temp_dir)
+        worker = create_mock_worker(temp_dir)
         
         assert worker.target_name == "test-target"
         assert worker.target_repo_url == "git@github.com:test/repo.git"
@@ -66,18 +70,18 @@ class TestWorkerEventBundle:
         assert worker.control_plane_url == "http://test-api:8000"
         assert worker.control_plane_token == "test-token"
     
-    def test_worker_missing_env_vars(self):
+    def test_worker_missing_env_vars(self, monkeypatch):
         """Worker should raise error if required env vars missing."""
-        os.environ.pop("TASK_ID")
+        monkeypatch.delenv("TASK_ID")
         
         with pytest.raises(WorkerError) as exc_info:
             Worker()
         
         assert "TASK_ID" in str(exc_info.value)
     
-    def test_emit_event_structure(self):
+    def test_emit_event_structure(self, temp_dir):
         """Emitted events should have correct structure."""
-        worker = create_mock_worker(self.temp_dir)
+        worker = create_mock_worker(temp_dir)
         
         worker._emit_event("test.event", {
             'test_field': 'test_value',
@@ -87,20 +91,17 @@ class TestWorkerEventBundle:
         assert len(worker.events) == 1
         event = worker.events[0]
         
-        # Verify event structure
-        assert 'event_id' in event
-        assert 'event_type' in event
-        assert 'timestamp' in event
-        assert 'actor_id' in event
-        assert 'payload' in event
+        # Verify event structure (buffered with ts_ns, posted with timestamp)
+        assert isinstance(event['ts_ns'], int)
+        assert_event_shape(_event_for_wire(event))
         
         assert event['event_type'] == 'test.event'
         assert event['actor_id'] == 'worker-attempt-abc123'
         assert event['payload']['test_field'] == 'test_value'
     
-    def test_event_bundle_structure(self):
+    def test_event_bundle_structure(self, temp_dir):
         """Event bundle should conform to control plane API schema."""
-        worker = create_mock_worker(self.temp_dir)
+        worker = create_mock_worker(temp_dir)
         
         # Emit some events
         worker._emit_event("attempt.started", {
@@ -125,7 +126,7 @@ class TestWorkerEventBundle:
         bundle = {
             'target': worker.target_name,
             'bundle_id': f"bundle-{worker.attempt_id}",
-            'events': worker.events,
+            'events': [_event_for_wire(event) for event in worker.events],
             'artifacts': worker.artifacts
         }
         
@@ -141,28 +142,20 @@ class TestWorkerEventBundle:
         
         # Verify event structure
         for event in bundle['events']:
-            assert 'event_id' in event
-            assert 'event_type' in event
-            assert 'timestamp' in event
-            assert 'actor_id' in event
-            assert 'payload' in event
+            assert_event_shape(event)
         
         # Verify artifact structure
-        artifact = bundle['artifacts'][0]
-        assert 'sha256' in artifact
-        assert 'kind' in artifact
-        assert 'uri' in artifact
-        assert 'size' in artifact
+        assert_artifact_shape(bundle['artifacts'][0])
     
     @patch('leviathan.executor.worker.requests.post')
-    def test_post_event_bundle(self, mock_post):
+    def test_post_event_bundle(self, mock_post, temp_dir):
         """Should post event bundle to control plane API."""
         # Mock successful response
         mock_response = Mock()
         mock_response.status_code = 200
         mock_post.return_value = mock_response
         
-        worker = create_mock_worker(self.temp_dir)
+        worker = create_mock_worker(temp_dir)
         
         # Emit event
         worker._emit_event("attempt.started", {
@@ -183,17 +176,68 @@ class TestWorkerEventBundle:
         # Verify headers
         assert 'Authorization' in call_args[1]['headers']
         assert call_args[1]['headers']['Authorization'] == 'Bearer test-token'
+        assert call_args[1]['headers']['Content-Type'] == 'application/json'
         
         # Verify payload
-        payload = call_args[1]['json']
+        payload = orjson.loads(call_args[1]['data'])
         assert payload['target'] == 'test-target'
         assert 'bundle_id' in payload
         assert 'events' in payload
         assert 'artifacts' in payload
+        for event in payload['events']:
+            assert_event_shape(event)
     
-    def test_artifact_reference_structure(self):
+    @patch('leviathan.executor.worker.requests.post')
+    def test_emit_event_flushes_at_threshold(self, mock_post, temp_dir, monkeypatch):
+        """Buffered events should be posted early (without artifacts) at the flush threshold."""
+        monkeypatch.setattr('leviathan.executor.worker.EVENT_FLUSH_THRESHOLD', 3)
+        mock_post.return_value = Mock(status_code=200)
+        
+        worker = create_mock_worker(temp_dir)
+        worker.artifacts.append({'sha256': 'a' * 64, 'kind': 'log', 'uri': 'file:///x', 'size': 1})
+        
+        worker._emit_event("e.one", {})
+        worker._emit_event("e.two", {})
+        assert not mock_post.called
+        
+        worker._emit_event("e.three", {})
+        
+        mock_post.assert_called_once()
+        payload = orjson.loads(mock_post.call_args[1]['data'])
+        assert [e['event_type'] for e in payload['events']] == ['e.one', 'e.two', 'e.three']
+        assert payload['artifacts'] == []
+        assert len(worker.events) == 0
+        assert len(worker.artifacts) == 1
+    
+    @patch('leviathan.executor.worker.requests.post')
+    def test_emit_event_failed_flush_keeps_events(self, mock_post, temp_dir, monkeypatch):
+        """A failed early flush should keep events buffered for the final bundle."""
+        monkeypatch.setattr('leviathan.executor.worker.EVENT_FLUSH_THRESHOLD', 2)
+        mock_post.side_effect = Exception("control plane down")
+        
+        worker = create_mock_worker(temp_dir)
+        worker._emit_event("e.one", {})
+        worker._emit_event("e.two", {})
+        
+        assert mock_post.called
+        assert len(worker.events) == 2
+    
+    @patch('leviathan.executor.worker.requests.post')
+    def test_emit_event_failed_flush_not_retried(self, mock_post, temp_dir, monkeypatch):
+        """After a failed early flush, later emits should not POST again."""
+        monkeypatch.setattr('leviathan.executor.worker.EVENT_FLUSH_THRESHOLD', 2)
+        mock_post.side_effect = Exception("control plane down")
+        
+        worker = create_mock_worker(temp_dir)
+        for i in range(7):
+            worker._emit_event(f"e.{i}", {})
+        
+        mock_post.assert_called_once()
+        assert len(worker.events) == 7
+    
+    def test_artifact_reference_structure(self, temp_dir):
         """Artifact references should have required fields."""
-        worker = create_mock_worker(self.temp_dir)
+        worker = create_mock_worker(temp_dir)
         
         # Add artifact
         worker.artifacts.append({
@@ -206,10 +250,7 @@ class TestWorkerEventBundle:
         artifact = worker.artifacts[0]
         
         # Verify required fields
-        assert 'sha256' in artifact
-        assert 'kind' in artifact
-        assert 'uri' in artifact
-        assert 'size' in artifact
+        assert_artifact_shape(artifact)
         
         # Verify types
         assert isinstance(artifact['sha256'], str)
@@ -220,9 +261,9 @@ class TestWorkerEventBundle:
         # Verify SHA256 format (64 hex chars)
         assert len(artifact['sha256']) == 64
     
-    def test_multiple_events_ordering(self):
+    def test_multiple_events_ordering(self, temp_dir):
         """Events should maintain order."""
-        worker = create_mock_worker(self.temp_dir)
+        worker = create_mock_worker(temp_dir)
         
         # Emit events in order
         worker._emit_event("attempt.started", {'status': 'running'})
@@ -235,13 +276,13 @@ class TestWorkerEventBundle:
         assert worker.events[1]['event_type'] == 'tests.passed'
         assert worker.events[2]['event_type'] == 'attempt.succeeded'
     
-    def test_event_timestamps(self):
+    def test_event_timestamps(self, temp_dir):
         """Events should have ISO format timestamps."""
-        worker = create_mock_worker(self.temp_dir)
+        worker = create_mock_worker(temp_dir)
         
         worker._emit_event("test.event", {'data': 'test'})
         
-        event = worker.events[0]
+        event = _event_for_wire(worker.events[0])
         timestamp = event['timestamp']
         
         # Verify ISO format (should parse without error)
@@ -249,21 +290,34 @@ class TestWorkerEventBundle:
         parsed = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
         assert parsed is not None
     
-    def test_event_actor_id(self):
+    def test_event_for_wire_converts_ts_ns(self):
+        """Buffered ts_ns should become a naive UTC ISO timestamp; indexer events pass through."""
+        event = {'event_type': 'test.event', 'ts_ns': 1_700_000_000_123_456_789, 'payload': {}}
+        
+        wire = _event_for_wire(event)
+        
+        assert wire['timestamp'] == '2023-11-14T22:13:20.123456'
+        assert 'ts_ns' not in wire
+        assert 'ts_ns' in event  # buffered event left untouched
+        
+        indexed = {'event_type': 'repo.indexed', 'timestamp': '2024-01-01T00:00:00', 'payload': {}}
+        assert _event_for_wire(indexed) is indexed
+    
+    def test_event_actor_id(self, temp_dir):
         """Events should have worker-specific actor ID."""
-        worker = create_mock_worker(self.temp_dir)
+        worker = create_mock_worker(temp_dir)
         
         worker._emit_event("test.event", {'data': 'test'})
         
         event = worker.events[0]
         assert event['actor_id'] == 'worker-attempt-abc123'
     
-    def test_load_task_spec_structure(self):
+    def test_load_task_spec_structure(self, temp_dir):
         """Task spec should return Task object with expected structure."""
         from leviathan.backlog import Task
         
-        worker = create_mock_worker(self.temp_dir)
-        worker.target_dir = self.temp_dir / "target"
+        worker = create_mock_worker(temp_dir)
+        worker.target_dir = temp_dir / "target"
         worker.target_dir.mkdir(parents=True, exist_ok=True)
         
         # Create mock backlog file
@@ -290,4 +344,36 @@ tasks:
         assert task_spec.id == 'task-001'
         assert task_spec.title == 'Test Task'
         assert task_spec.scope == 'test'
-        assert isinstance(task_spec.allowed_paths, list)
+        assert isinstance(task_spec.allowed_paths, tuple)
+
+    def test_load_task_spec_large_backlog_skips_full_parse(self, temp_dir, monkeypatch):
+        """Task lookup in a large backlog should parse only the matching task."""
+        import leviathan.backlog_loader as backlog_loader
+        
+        worker = create_mock_worker(temp_dir)
+        worker.task_id = "task-0777"
+        worker.target_dir = temp_dir / "target"
+        backlog_dir = worker.target_dir / ".leviathan"
+        backlog_dir.mkdir(parents=True)
+        
+        lines = ["tasks:\n"]
+        for i in range(1000):
+            lines.append(f"  - id: task-{i:04d}\n")
+            lines.append(f"    title: Task {i}\n")
+            lines.append(f"    scope: test\n")
+            lines.append(f"    allowed_paths: [src/file_{i}.py]\n")
+        (backlog_dir / "backlog.yaml").write_text("".join(lines))
+        
+        full_parses = []
+        original = backlog_loader.load_backlog_tasks
+        monkeypatch.setattr(
+            backlog_loader, "load_backlog_tasks",
+            lambda path: full_parses.append(path) or original(path)
+        )
+        
+        task_spec = worker._load_task_spec()
+        
+        assert task_spec.id == 'task-0777'
+        assert task_spec.title == 'Task 777'
+        assert task_spec.allowed_paths == ('src/file_777.py',)
+        assert full_parses == []
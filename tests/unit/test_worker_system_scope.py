@@ -3,13 +3,16 @@ Unit tests for worker system-scope task fallback.
 
 Tests that topology and bootstrap tasks can run without backlog entries,
 and that event bundles include proper target and attempt lifecycle events.
+
+All per-test state lives in tmp_path/monkeypatch and the shared backlog
+fixture is read-only, so the file is safe under pytest-xdist (-n auto).
 """
 import pytest
+import orjson
 import os
-import tempfile
 import shutil
+from collections import deque
 from unittest.mock import Mock, patch, MagicMock
-from pathlib import Path
 
 from leviathan.executor.worker import Worker, WorkerError
 from leviathan.backlog import Task
@@ -27,29 +30,53 @@ def create_mock_worker(temp_dir, task_id="task-001"):
     worker.control_plane_token = "test-token"
     worker.workspace = temp_dir
     worker.target_dir = temp_dir / "target"
-    worker.events = []
+    worker.events = deque()
     worker.artifacts = []
     return worker
 
 
+@pytest.fixture(scope="session")
+def backlog_with_other_task(tmp_path_factory):
+    """Read-only .leviathan/ dir whose backlog holds only 'some-other-task'."""
+    backlog_dir = tmp_path_factory.mktemp("backlog_other") / ".leviathan"
+    backlog_dir.mkdir()
+    (backlog_dir / "backlog.yaml").write_text("""
+tasks:
+  - id: some-other-task
+    title: Other Task
+    scope: feature
+    priority: high
+    ready: true
+    estimated_size: small
+    allowed_paths: []
+    acceptance_criteria: []
+    dependencies: []
+""")
+    return backlog_dir
+
+
+def link_backlog(backlog_dir, target_dir):
+    """Expose a shared .leviathan/ dir inside target_dir (copy where symlinks are unavailable)."""
+    try:
+        os.symlink(backlog_dir, target_dir / ".leviathan", target_is_directory=True)
+    except OSError:
+        shutil.copytree(backlog_dir, target_dir / ".leviathan")
+
+
 class TestSystemScopeFallback:
     """Test system-scope task fallback for topology and bootstrap."""
     
-    def setup_method(self):
-        """Set up test environment."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-        self.target_dir = self.temp_dir / "target"
-        self.target_dir.mkdir(parents=True, exist_ok=True)
+    @pytest.fixture
+    def target_dir(self, tmp_path):
+        """Target repo directory under the per-test tmp_path."""
+        target_dir = tmp_path / "target"
+        target_dir.mkdir()
+        return target_dir
     
-    def teardown_method(self):
-        """Clean up test environment."""
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
-    
-    def test_topology_system_scope_fallback_no_backlog(self):
+    def test_topology_system_scope_fallback_no_backlog(self, tmp_path, target_dir):
         """Should create synthetic topology task when backlog doesn't exist."""
-        worker = create_mock_worker(self.temp_dir, task_id="topology-test-target-v1")
-        worker.target_dir = self.target_dir
+        worker = create_mock_worker(tmp_path, task_id="topology-test-target-v1")
+        worker.target_dir = target_dir
         
         # Don't create backlog file
         
@@ -60,14 +87,14 @@ class TestSystemScopeFallback:
         assert task.id == "topology-test-target-v1"
         assert task.scope == "topology"
         assert task.ready is True
-        assert task.allowed_paths == []
+        assert task.allowed_paths == ()
         assert "SYSTEM" in task.title
         assert "topology" in task.title.lower()
     
-    def test_bootstrap_system_scope_fallback_no_backlog(self):
+    def test_bootstrap_system_scope_fallback_no_backlog(self, tmp_path, target_dir):
         """Should create synthetic bootstrap task when backlog doesn't exist."""
-        worker = create_mock_worker(self.temp_dir, task_id="bootstrap-test-target-v1")
-        worker.target_dir = self.target_dir
+        worker = create_mock_worker(tmp_path, task_id="bootstrap-test-target-v1")
+        worker.target_dir = target_dir
         
         # Don't create backlog file
         
@@ -78,31 +105,17 @@ class TestSystemScopeFallback:
         assert task.id == "bootstrap-test-target-v1"
         assert task.scope == "bootstrap"
         assert task.ready is True
-        assert task.allowed_paths == []
+        assert task.allowed_paths == ()
         assert "SYSTEM" in task.title
         assert "bootstrap" in task.title.lower()
     
-    def test_topology_system_scope_fallback_task_not_in_backlog(self):
+    def test_topology_system_scope_fallback_task_not_in_backlog(self, tmp_path, target_dir, backlog_with_other_task):
         """Should create synthetic topology task when task not found in backlog."""
-        worker = create_mock_worker(self.temp_dir, task_id="topology-myrepo-v1")
-        worker.target_dir = self.target_dir
+        worker = create_mock_worker(tmp_path, task_id="topology-myrepo-v1")
+        worker.target_dir = target_dir
         
-        # Create backlog with different tasks
-        backlog_dir = self.target_dir / ".leviathan"
-        backlog_dir.mkdir(parents=True, exist_ok=True)
-        backlog_file = backlog_dir / "backlog.yaml"
-        backlog_file.write_text("""
-tasks:
-  - id: some-other-task
-    title: Other Task
-    scope: feature
-    priority: high
-    ready: true
-    estimated_size: small
-    allowed_paths: []
-    acceptance_criteria: []
-    dependencies: []
-""")
+        # Backlog with different tasks
+        link_backlog(backlog_with_other_task, target_dir)
         
         task = worker._load_task_spec()
         
@@ -112,27 +125,13 @@ tasks:
         assert task.scope == "topology"
         assert task.ready is True
     
-    def test_bootstrap_system_scope_fallback_task_not_in_backlog(self):
+    def test_bootstrap_system_scope_fallback_task_not_in_backlog(self, tmp_path, target_dir, backlog_with_other_task):
         """Should create synthetic bootstrap task when task not found in backlog."""
-        worker = create_mock_worker(self.temp_dir, task_id="bootstrap-myrepo-v1")
-        worker.target_dir = self.target_dir
+        worker = create_mock_worker(tmp_path, task_id="bootstrap-myrepo-v1")
+        worker.target_dir = target_dir
         
-        # Create backlog with different tasks
-        backlog_dir = self.target_dir / ".leviathan"
-        backlog_dir.mkdir(parents=True, exist_ok=True)
-        backlog_file = backlog_dir / "backlog.yaml"
-        backlog_file.write_text("""
-tasks:
-  - id: some-other-task
-    title: Other Task
-    scope: feature
-    priority: high
-    ready: true
-    estimated_size: small
-    allowed_paths: []
-    acceptance_criteria: []
-    dependencies: []
-""")
+        # Backlog with different tasks
+        link_backlog(backlog_with_other_task, target_dir)
         
         task = worker._load_task_spec()
         
@@ -142,10 +141,10 @@ tasks:
         assert task.scope == "bootstrap"
         assert task.ready is True
     
-    def test_non_system_task_not_found_raises_error(self):
+    def test_non_system_task_not_found_raises_error(self, tmp_path, target_dir):
         """Should raise helpful error for non-system tasks not in backlog."""
-        worker = create_mock_worker(self.temp_dir, task_id="regular-task-123")
-        worker.target_dir = self.target_dir
+        worker = create_mock_worker(tmp_path, task_id="regular-task-123")
+        worker.target_dir = target_dir
         worker.target_name = "myrepo"
         
         # Don't create backlog file
@@ -159,10 +158,10 @@ tasks:
         assert "bootstrap-myrepo-v1" in error_msg
         assert ".leviathan/backlog.yaml" in error_msg
     
-    def test_topology_task_wrong_version_raises_error(self):
+    def test_topology_task_wrong_version_raises_error(self, tmp_path, target_dir):
         """Should not use fallback for topology tasks with wrong version."""
-        worker = create_mock_worker(self.temp_dir, task_id="topology-test-v2")
-        worker.target_dir = self.target_dir
+        worker = create_mock_worker(tmp_path, task_id="topology-test-v2")
+        worker.target_dir = target_dir
         
         # Don't create backlog file
         
@@ -172,10 +171,10 @@ tasks:
         # Should not use fallback (wrong version)
         assert "not found in backlog" in str(exc_info.value)
     
-    def test_bootstrap_task_wrong_version_raises_error(self):
+    def test_bootstrap_task_wrong_version_raises_error(self, tmp_path, target_dir):
         """Should not use fallback for bootstrap tasks with wrong version."""
-        worker = create_mock_worker(self.temp_dir, task_id="bootstrap-test-v2")
-        worker.target_dir = self.target_dir
+        worker = create_mock_worker(tmp_path, task_id="bootstrap-test-v2")
+        worker.target_dir = target_dir
         
         # Don't create backlog file
         
@@ -185,13 +184,13 @@ tasks:
         # Should not use fallback (wrong version)
         assert "not found in backlog" in str(exc_info.value)
     
-    def test_task_in_backlog_takes_precedence(self):
+    def test_task_in_backlog_takes_precedence(self, tmp_path, target_dir):
         """Should use backlog entry if topology task is defined there."""
-        worker = create_mock_worker(self.temp_dir, task_id="topology-test-target-v1")
-        worker.target_dir = self.target_dir
+        worker = create_mock_worker(tmp_path, task_id="topology-test-target-v1")
+        worker.target_dir = target_dir
         
         # Create backlog with explicit topology task
-        backlog_dir = self.target_dir / ".leviathan"
+        backlog_dir = target_dir / ".leviathan"
         backlog_dir.mkdir(parents=True, exist_ok=True)
         backlog_file = backlog_dir / "backlog.yaml"
         backlog_file.write_text("""
@@ -213,24 +212,15 @@ tasks:
         assert task.title == "Custom Topology Task"
         assert task.priority == "low"
         assert task.estimated_size == "large"
-        assert task.allowed_paths == ["custom/path.py"]
+        assert task.allowed_paths == ("custom/path.py",)
 
 
 class TestAttemptLifecycle:
     """Test that attempt lifecycle events are emitted correctly."""
     
-    def setup_method(self):
-        """Set up test environment."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-    
-    def teardown_method(self):
-        """Clean up test environment."""
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
-    
-    def test_attempt_created_emitted_first(self):
+    def test_attempt_created_emitted_first(self, tmp_path):
         """Should emit attempt.created before attempt.started."""
-        worker = create_mock_worker(self.temp_dir)
+        worker = create_mock_worker(tmp_path)
         
         # Emit events as worker.run() does
         worker._emit_event("attempt.created", {
@@ -252,101 +242,36 @@ class TestAttemptLifecycle:
         assert worker.events[0]['event_type'] == 'attempt.created'
         assert worker.events[1]['event_type'] == 'attempt.started'
     
-    def test_attempt_created_includes_required_fields(self):
-        """Should include attempt_id, task_id, target_id, attempt_number in attempt.created."""
-        worker = create_mock_worker(self.temp_dir)
-        
-        worker._emit_event("attempt.created", {
+    @pytest.mark.parametrize("event_type,extra", [
+        ("attempt.created", {'attempt_number': 1, 'status': 'created'}),
+        ("attempt.started", {'status': 'running'}),
+        ("attempt.failed", {'status': 'failed', 'failure_type': 'test_failure'}),
+        ("attempt.succeeded", {'status': 'succeeded'}),
+    ])
+    def test_attempt_event_includes_required_fields(self, tmp_path, event_type, extra):
+        """Should include attempt_id, task_id, target_id plus event-specific fields."""
+        worker = create_mock_worker(tmp_path)
+        
+        payload = {
             'attempt_id': 'attempt-123',
             'task_id': 'task-456',
             'target_id': 'test-target',
-            'attempt_number': 1,
-            'status': 'created',
-        })
-        
-        event = worker.events[0]
-        payload = event['payload']
-        
-        assert payload['attempt_id'] == 'attempt-123'
-        assert payload['task_id'] == 'task-456'
-        assert payload['target_id'] == 'test-target'
-        assert payload['attempt_number'] == 1
-        assert payload['status'] == 'created'
-    
-    def test_attempt_started_includes_required_fields(self):
-        """Should include attempt_id, task_id, target_id in attempt.started."""
-        worker = create_mock_worker(self.temp_dir)
-        
-        worker._emit_event("attempt.started", {
-            'attempt_id': 'attempt-123',
-            'task_id': 'task-456',
-            'target_id': 'test-target',
-            'status': 'running',
-        })
-        
-        event = worker.events[0]
-        payload = event['payload']
-        
-        assert payload['attempt_id'] == 'attempt-123'
-        assert payload['task_id'] == 'task-456'
-        assert payload['target_id'] == 'test-target'
-        assert payload['status'] == 'running'
-    
-    def test_attempt_failed_includes_required_fields(self):
-        """Should include attempt_id, task_id, target_id in attempt.failed."""
-        worker = create_mock_worker(self.temp_dir)
-        
-        worker._emit_event("attempt.failed", {
-            'attempt_id': 'attempt-123',
-            'task_id': 'task-456',
-            'target_id': 'test-target',
-            'status': 'failed',
-            'failure_type': 'test_failure',
-        })
-        
-        event = worker.events[0]
-        payload = event['payload']
-        
-        assert payload['attempt_id'] == 'attempt-123'
-        assert payload['task_id'] == 'task-456'
-        assert payload['target_id'] == 'test-target'
-        assert payload['status'] == 'failed'
-    
-    def test_attempt_succeeded_includes_required_fields(self):
-        """Should include attempt_id, task_id, target_id in attempt.succeeded."""
-        worker = create_mock_worker(self.temp_dir)
-        
-        worker._emit_event("attempt.succeeded", {
-            'attempt_id': 'attempt-123',
-            'task_id': 'task-456',
-            'target_id': 'test-target',
-            'status': 'succeeded',
-        })
+            **extra,
+        }
+        worker._emit_event(event_type, payload)
         
         event = worker.events[0]
-        payload = event['payload']
         
-        assert payload['attempt_id'] == 'attempt-123'
-        assert payload['task_id'] == 'task-456'
-        assert payload['target_id'] == 'test-target'
-        assert payload['status'] == 'succeeded'
+        assert event['event_type'] == event_type
+        assert event['payload'] == payload
 
 
 class TestEventBundleTarget:
     """Test that event bundles include target field."""
     
-    def setup_method(self):
-        """Set up test environment."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-    
-    def teardown_method(self):
-        """Clean up test environment."""
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
-    
-    def test_event_bundle_includes_target(self):
+    def test_event_bundle_includes_target(self, tmp_path):
         """Event bundle should include top-level 'target' field."""
-        worker = create_mock_worker(self.temp_dir)
+        worker = create_mock_worker(tmp_path)
         worker.target_name = "my-repo"
         
         # Emit some events
@@ -365,13 +290,13 @@ class TestEventBundleTarget:
         assert bundle['target'] == 'my-repo'
     
     @patch('leviathan.executor.worker.requests.post')
-    def test_post_event_bundle_sends_target(self, mock_post):
+    def test_post_event_bundle_sends_target(self, mock_post, tmp_path):
         """Should send target field in event bundle POST request."""
         mock_response = Mock()
         mock_response.status_code = 200
         mock_post.return_value = mock_response
         
-        worker = create_mock_worker(self.temp_dir)
+        worker = create_mock_worker(tmp_path)
         worker.target_name = "test-repo"
         
         worker._emit_event("attempt.started", {'attempt_id': 'attempt-123'})
@@ -382,14 +307,14 @@ class TestEventBundleTarget:
         
         # Verify payload includes target
         call_args = mock_post.call_args
-        payload = call_args[1]['json']
+        payload = orjson.loads(call_args[1]['data'])
         
         assert 'target' in payload
         assert payload['target'] == 'test-repo'
     
-    def test_event_bundle_target_matches_worker_target_name(self):
+    def test_event_bundle_target_matches_worker_target_name(self, tmp_path):
         """Event bundle target should match worker's target_name."""
-        worker = create_mock_worker(self.temp_dir)
+        worker = create_mock_worker(tmp_path)
         worker.target_name = "leviathan"
         
         bundle = {
@@ -1,42 +1,42 @@
 """
 Unit tests for worker task loading and typed Task objects.
 """
+import dataclasses
+import os
+import orjson
 import pytest
 import tempfile
+import yaml
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
+from leviathan import backlog_loader
 from leviathan.executor.worker import Worker, WorkerError
 from leviathan.backlog import Task
 
 
-class TestWorkerTaskLoading:
-    """Test worker task loading with typed Task objects."""
-    
-    def setup_method(self):
-        """Set up test environment."""
-        self.temp_dir = Path(tempfile.mkdtemp())
-        self.target_dir = self.temp_dir / "target"
-        self.target_dir.mkdir(parents=True, exist_ok=True)
-        self.backlog_dir = self.target_dir / ".leviathan"
-        self.backlog_dir.mkdir(parents=True, exist_ok=True)
-    
-    def teardown_method(self):
-        """Clean up test environment."""
-        import shutil
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
-    
-    def test_load_task_spec_dict_format(self):
-        """Should load task from dict format backlog and return Task object."""
-        worker = Mock(spec=Worker)
-        worker.task_id = "task-001"
-        worker.target_dir = self.target_dir
-        worker._load_task_spec = Worker._load_task_spec.__get__(worker)
-        
-        # Create backlog with dict format
-        backlog_file = self.backlog_dir / "backlog.yaml"
-        backlog_file.write_text("""
+def _fast_rmtree(root: Path):
+    """Remove a small test tree with one os.scandir per directory and no recursion."""
+    stack = [(str(root), False)]
+    try:
+        while stack:
+            path, emptied = stack.pop()
+            if emptied:
+                os.rmdir(path)
+                continue
+            stack.append((path, True))
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((entry.path, False))
+                    else:
+                        os.unlink(entry.path)
+    except FileNotFoundError:
+        pass
+
+
+# Backlog fixtures as UTF-8 bytes, written with write_bytes (no per-test encode)
+FIXTURE_DICT_FORMAT = b"""
 version: 1
 max_open_prs: 2
 tasks:
@@ -53,7 +53,97 @@ tasks:
       - Tests pass
       - Code is clean
     dependencies: []
-""")
+"""
+
+FIXTURE_LIST_FORMAT = b"""
+- id: task-002
+  title: Another Task
+  scope: feature
+  priority: medium
+  ready: true
+  estimated_size: medium
+  allowed_paths:
+    - lib/feature.py
+  acceptance_criteria:
+    - Feature works
+  dependencies: []
+"""
+
+FIXTURE_TASK_ID_KEY = b"""
+tasks:
+  - task_id: task-003
+    title: Legacy Format Task
+    scope: test
+    priority: low
+    ready: true
+    estimated_size: small
+    allowed_paths: []
+    acceptance_criteria: []
+    dependencies: []
+"""
+
+
+# Attribute names for Mock(spec=...), computed once instead of dir(Worker) per mock
+_WORKER_SPEC = dir(Worker)
+
+
+def _make_worker(task_id, target_dir):
+    """Worker mock with the real _load_task_spec bound to it."""
+    worker = Mock(spec=_WORKER_SPEC)
+    worker.task_id = task_id
+    worker.target_name = "test-target"
+    worker.target_dir = target_dir
+    worker._load_task_spec = Worker._load_task_spec.__get__(worker)
+    return worker
+
+
+@pytest.fixture(scope="class")
+def backlog_env():
+    """One target dir per test class; yields (target_dir, backlog_file)."""
+    temp_dir = Path(tempfile.mkdtemp())
+    target_dir = temp_dir / "target"
+    backlog_dir = target_dir / ".leviathan"
+    backlog_dir.mkdir(parents=True)
+    yield target_dir, backlog_dir / "backlog.yaml"
+    _fast_rmtree(temp_dir)
+
+
+class TestWorkerTaskLoading:
+    """Test worker task loading with typed Task objects."""
+    
+    @pytest.fixture(autouse=True)
+    def fresh_backlog(self, backlog_env):
+        """Start each test without a backlog file or cached parses of the shared path."""
+        backlog_env[1].unlink(missing_ok=True)
+        backlog_env[1].with_name("backlog.json").unlink(missing_ok=True)
+        backlog_loader._parse_backlog_file.cache_clear()
+        backlog_loader._load_backlog_task_cached.cache_clear()
+        backlog_loader._index_backlog_file.cache_clear()
+    
+    @pytest.fixture
+    def stub_backlog(self, backlog_env, monkeypatch):
+        """Serve pre-parsed task dicts to _load_task_spec, skipping YAML entirely."""
+        def install(*tasks):
+            backlog_env[1].touch()  # _load_task_spec only loads from an existing file
+            by_id = {task['id']: task for task in tasks}
+            monkeypatch.setattr(
+                "leviathan.executor.worker.load_backlog_task",
+                lambda path, task_id: by_id.get(task_id)
+            )
+        return install
+    
+    @pytest.mark.skipif(not hasattr(yaml, "CSafeLoader"), reason="PyYAML built without libyaml")
+    def test_backlog_parsed_with_libyaml(self):
+        """Task loading should parse backlogs with the C SafeLoader when available."""
+        assert backlog_loader._YamlLoader is yaml.CSafeLoader
+    
+    def test_load_task_spec_dict_format(self, backlog_env):
+        """Should load task from dict format backlog and return Task object."""
+        target_dir, backlog_file = backlog_env
+        worker = _make_worker("task-001", target_dir)
+        
+        # Create backlog with dict format
+        backlog_file.write_bytes(FIXTURE_DICT_FORMAT)
         
         task = worker._load_task_spec()
         
@@ -68,38 +158,23 @@ tasks:
         assert task.ready is True
         assert task.estimated_size == "small"
         
-        # Verify allowed_paths is a list
-        assert isinstance(task.allowed_paths, list)
+        # Verify allowed_paths is a tuple
+        assert isinstance(task.allowed_paths, tuple)
         assert len(task.allowed_paths) == 2
         assert "src/test.py" in task.allowed_paths
         
-        # Verify acceptance_criteria is a list
-        assert isinstance(task.acceptance_criteria, list)
+        # Verify acceptance_criteria is a tuple
+        assert isinstance(task.acceptance_criteria, tuple)
         assert len(task.acceptance_criteria) == 2
         assert "Tests pass" in task.acceptance_criteria
     
-    def test_load_task_spec_list_format(self):
+    def test_load_task_spec_list_format(self, backlog_env):
         """Should load task from list format backlog and return Task object."""
-        worker = Mock(spec=Worker)
-        worker.task_id = "task-002"
-        worker.target_dir = self.target_dir
-        worker._load_task_spec = Worker._load_task_spec.__get__(worker)
+        target_dir, backlog_file = backlog_env
+        worker = _make_worker("task-002", target_dir)
         
         # Create backlog with list format (no 'tasks' key)
-        backlog_file = self.backlog_dir / "backlog.yaml"
-        backlog_file.write_text("""
-- id: task-002
-  title: Another Task
-  scope: feature
-  priority: medium
-  ready: true
-  estimated_size: medium
-  allowed_paths:
-    - lib/feature.py
-  acceptance_criteria:
-    - Feature works
-  dependencies: []
-""")
+        backlog_file.write_bytes(FIXTURE_LIST_FORMAT)
         
         task = worker._load_task_spec()
         
@@ -107,87 +182,75 @@ tasks:
         assert isinstance(task, Task)
         assert task.id == "task-002"
         assert task.title == "Another Task"
-        assert isinstance(task.allowed_paths, list)
+        assert isinstance(task.allowed_paths, tuple)
         assert len(task.allowed_paths) == 1
     
-    def test_load_task_spec_task_id_normalization(self):
+    def test_load_task_spec_task_id_normalization(self, backlog_env):
         """Should normalize 'task_id' to 'id' field."""
-        worker = Mock(spec=Worker)
-        worker.task_id = "task-003"
-        worker.target_dir = self.target_dir
-        worker._load_task_spec = Worker._load_task_spec.__get__(worker)
+        target_dir, backlog_file = backlog_env
+        worker = _make_worker("task-003", target_dir)
         
         # Create backlog with 'task_id' instead of 'id'
-        backlog_file = self.backlog_dir / "backlog.yaml"
-        backlog_file.write_text("""
-tasks:
-  - task_id: task-003
-    title: Legacy Format Task
-    scope: test
-    priority: low
-    ready: true
-    estimated_size: small
-    allowed_paths: []
-    acceptance_criteria: []
-    dependencies: []
-""")
+        backlog_file.write_bytes(FIXTURE_TASK_ID_KEY)
         
         task = worker._load_task_spec()
         
         assert isinstance(task, Task)
         assert task.id == "task-003"
     
-    def test_load_task_spec_not_found(self):
+    def test_load_task_spec_not_found(self, backlog_env, stub_backlog):
         """Should raise WorkerError if task not found."""
-        worker = Mock(spec=Worker)
-        worker.task_id = "nonexistent-task"
-        worker.target_name = "test-target"
-        worker.target_dir = self.target_dir
-        worker._load_task_spec = Worker._load_task_spec.__get__(worker)
-        
-        backlog_file = self.backlog_dir / "backlog.yaml"
-        backlog_file.write_text("""
-tasks:
-  - id: task-001
-    title: Test Task
-    scope: test
-    priority: high
-    ready: true
-    estimated_size: small
-    allowed_paths: []
-    acceptance_criteria: []
-    dependencies: []
-""")
+        target_dir, backlog_file = backlog_env
+        worker = _make_worker("nonexistent-task", target_dir)
+        
+        stub_backlog({'id': 'task-001', 'title': 'Test Task', 'scope': 'test'})
         
         with pytest.raises(WorkerError, match="Task nonexistent-task not found"):
             worker._load_task_spec()
     
-    def test_load_task_spec_backlog_not_found(self):
+    def test_load_task_spec_json_fast_path(self, backlog_env):
+        """Should prefer backlog.json and build the same Task as the YAML backlog."""
+        target_dir, backlog_file = backlog_env
+        worker = _make_worker("task-006", target_dir)
+        
+        task_data = {
+            'id': 'task-006',
+            'title': 'JSON Task',
+            'scope': 'test',
+            'priority': 'high',
+            'ready': True,
+            'estimated_size': 'small',
+            'allowed_paths': ['src/a.py'],
+            'acceptance_criteria': ['Tests pass'],
+            'dependencies': [],
+        }
+        backlog_file.write_text(yaml.safe_dump({'tasks': [task_data]}))
+        yaml_task = worker._load_task_spec()
+        
+        json_file = backlog_file.with_name("backlog.json")
+        json_file.write_bytes(orjson.dumps({'tasks': [dict(task_data, title='JSON wins')]}))
+        json_task = worker._load_task_spec()
+        
+        assert json_task.title == 'JSON wins'
+        assert json_task == dataclasses.replace(yaml_task, title='JSON wins')
+    
+    def test_load_task_spec_backlog_not_found(self, backlog_env):
         """Should raise WorkerError if backlog file doesn't exist and task is not system-scope."""
-        worker = Mock(spec=Worker)
-        worker.task_id = "task-001"
-        worker.target_name = "test-target"
-        worker.target_dir = self.target_dir
-        worker._load_task_spec = Worker._load_task_spec.__get__(worker)
+        target_dir, backlog_file = backlog_env
+        worker = _make_worker("task-001", target_dir)
         
         # Don't create backlog file
         
         with pytest.raises(WorkerError, match="not found in backlog"):
             worker._load_task_spec()
     
-    def test_load_task_spec_defaults(self):
+    def test_load_task_spec_defaults(self, backlog_env, stub_backlog):
         """Should use defaults for optional fields."""
-        worker = Mock(spec=Worker)
-        worker.task_id = "task-004"
-        worker.target_dir = self.target_dir
-        worker._load_task_spec = Worker._load_task_spec.__get__(worker)
-        
-        # Create minimal backlog
-        backlog_file = self.backlog_dir / "backlog.yaml"
-        backlog_file.write_text("""
-tasks:
-  - id: task-004
-""")
+        target_dir, backlog_file = backlog_env
+        worker = _make_worker("task-004", target_dir)
+        
+        # Minimal task: only the id
+        stub_backlog({'id': 'task-004'})
         
         task = worker._load_task_spec()
         
@@ -197,32 +260,25 @@ tasks:
         assert task.scope == "unknown"
         assert task.priority == "medium"
         assert task.ready is True
-        assert task.allowed_paths == []
-        assert task.acceptance_criteria == []
-        assert task.dependencies == []
+        assert task.allowed_paths == ()
+        assert task.acceptance_criteria == ()
+        assert task.dependencies == ()
         assert task.estimated_size == "unknown"
     
-    def test_allowed_paths_is_list(self):
-        """Should ensure allowed_paths is always a list."""
-        worker = Mock(spec=Worker)
-        worker.task_id = "task-005"
-        worker.target_dir = self.target_dir
-        worker._load_task_spec = Worker._load_task_spec.__get__(worker)
-        
-        backlog_file = self.backlog_dir / "backlog.yaml"
-        backlog_file.write_text("""
-tasks:
-  - id: task-005
-    title: Test
-    allowed_paths:
-      - file1.py
-      - file2.py
-      - file3.py
-""")
+    def test_allowed_paths_is_tuple(self, backlog_env, stub_backlog):
+        """Should ensure allowed_paths is always a tuple."""
+        target_dir, backlog_file = backlog_env
+        worker = _make_worker("task-005", target_dir)
+        
+        stub_backlog({
+            'id': 'task-005',
+            'title': 'Test',
+            'allowed_paths': ['file1.py', 'file2.py', 'file3.py'],
+        })
         
         task = worker._load_task_spec()
         
-        assert isinstance(task.allowed_paths, list)
+        assert isinstance(task.allowed_paths, tuple)
         assert len(task.allowed_paths) == 3
         
         # Verify we can iterate over it
@@ -233,17 +289,31 @@ tasks:
 class TestWorkerTaskExecution:
     """Test worker task execution with typed Task objects."""
     
-    def test_execute_task_validates_allowed_paths(self):
-        """Should validate that allowed_paths is a list."""
-        worker = Mock(spec=Worker)
+    @pytest.fixture
+    def execute_task_harness(self, monkeypatch):
+        """Worker mock with the real _execute_task bound and ModelClient patched; returns (worker, model)."""
+        mock_instance = Mock()
+        monkeypatch.setattr('leviathan.executor.worker.ModelClient', Mock(return_value=mock_instance))
+        
+        worker = Mock(spec=_WORKER_SPEC)
         worker.target_dir = Path("/tmp/test")
         worker.attempt_id = "attempt-123"
         worker.task_id = "task-001"
         worker.artifact_store = Mock()
+        worker.artifact_store.store = Mock(return_value={
+            'sha256': 'a' * 64,
+            'size_bytes': 1024,
+            'storage_path': '/tmp/log.txt'
+        })
         worker.artifacts = []
         worker.events = []
         worker._emit_event = Mock()
         worker._execute_task = Worker._execute_task.__get__(worker)
+        return worker, mock_instance
+    
+    def test_execute_task_validates_allowed_paths(self, execute_task_harness):
+        """Should reject allowed_paths that is not a list or tuple (e.g. a str)."""
+        worker, _ = execute_task_harness
         
         # Create task with invalid allowed_paths
         task = Task(
@@ -261,43 +331,42 @@ class TestWorkerTaskExecution:
         with pytest.raises(WorkerError, match="allowed_paths must be a list"):
             worker._execute_task(task)
     
-    @patch('leviathan.executor.worker.ModelClient')
-    def test_execute_task_uses_task_attributes(self, mock_model_client):
-        """Should access task fields via attributes, not dict keys."""
-        worker = Mock(spec=Worker)
-        worker.target_dir = Path("/tmp/test")
-        worker.attempt_id = "attempt-123"
-        worker.task_id = "task-001"
-        worker.artifact_store = Mock()
-        worker.artifact_store.store = Mock(return_value={
-            'sha256': 'a' * 64,
-            'size_bytes': 1024,
-            'storage_path': '/tmp/log.txt'
-        })
-        worker.artifacts = []
-        worker.events = []
-        worker._emit_event = Mock()
-        worker._execute_task = Worker._execute_task.__get__(worker)
-        
-        # Mock model client to return success
-        mock_instance = Mock()
-        mock_instance.generate_implementation_rewrite_mode = Mock(
-            return_value=(['file1.py'], 'test-source')
-        )
-        mock_model_client.return_value = mock_instance
-        
-        # Create valid task
-        task = Task(
-            id="task-001",
-            title="Test Task",
-            scope="test",
-            priority="high",
-            ready=True,
-            allowed_paths=["file1.py", "file2.py"],
-            acceptance_criteria=["Tests pass"],
-            dependencies=[],
-            estimated_size="small"
-        )
+    @pytest.mark.parametrize("task,model_output,expected_log", [
+        (
+            Task(
+                id="task-001",
+                title="Test Task",
+                scope="test",
+                priority="high",
+                ready=True,
+                allowed_paths=["file1.py", "file2.py"],
+                acceptance_criteria=["Tests pass"],
+                dependencies=[],
+                estimated_size="small"
+            ),
+            (['file1.py'], 'test-source'),
+            ["Test Task", "file1.py"],
+        ),
+        (
+            Task(
+                id="task-002",
+                title="Feature Implementation",
+                scope="feature",
+                priority="medium",
+                ready=True,
+                allowed_paths=["src/feature.py", "tests/test_feature.py"],
+                acceptance_criteria=["Feature works", "Tests pass"],
+                dependencies=[],
+                estimated_size="medium"
+            ),
+            (['output.py'], 'claude'),
+            ["Feature Implementation", "feature", "src/feature.py"],
+        ),
+    ])
+    def test_execute_task(self, execute_task_harness, task, model_output, expected_log):
+        """Should read task.title/scope/allowed_paths as attributes and pass the Task to the model."""
+        worker, mock_instance = execute_task_harness
+        mock_instance.generate_implementation_rewrite_mode = Mock(return_value=model_output)
         
         # Should not raise AttributeError
         result = worker._execute_task(task)
@@ -309,51 +378,8 @@ class TestWorkerTaskExecution:
             task,
             retry_context=None
         )
-    
-    @patch('leviathan.executor.worker.ModelClient')
-    def test_execute_task_accesses_title_scope_allowed_paths(self, mock_model_client):
-        """Should access task.title, task.scope, task.allowed_paths without errors."""
-        worker = Mock(spec=Worker)
-        worker.target_dir = Path("/tmp/test")
-        worker.attempt_id = "attempt-456"
-        worker.task_id = "task-002"
-        worker.artifact_store = Mock()
-        worker.artifact_store.store = Mock(return_value={
-            'sha256': 'b' * 64,
-            'size_bytes': 2048,
-            'storage_path': '/tmp/log2.txt'
-        })
-        worker.artifacts = []
-        worker.events = []
-        worker._emit_event = Mock()
-        worker._execute_task = Worker._execute_task.__get__(worker)
-        
-        mock_instance = Mock()
-        mock_instance.generate_implementation_rewrite_mode = Mock(
-            return_value=(['output.py'], 'claude')
-        )
-        mock_model_client.return_value = mock_instance
-        
-        task = Task(
-            id="task-002",
-            title="Feature Implementation",
-            scope="feature",
-            priority="medium",
-            ready=True,
-            allowed_paths=["src/feature.py", "tests/test_feature.py"],
-            acceptance_criteria=["Feature works", "Tests pass"],
-            dependencies=[],
-            estimated_size="medium"
-        )
-        
-        result = worker._execute_task(task)
-        
-        assert result is True
         
         # Verify artifact log contains task attributes
-        log_call = worker.artifact_store.store.call_args
-        log_content = log_call[0][0].decode('utf-8')
-        
-        assert "Feature Implementation" in log_content
-        assert "feature" in log_content
-        assert "src/feature.py" in log_content or "allowed_paths" in log_content
+        log_content = worker.artifact_store.store.call_args[0][0].decode('utf-8')
+        for expected in expected_log:
+            assert expected in log_content
@@ -6,27 +6,285 @@ Validates that repository configuration files match canonical invariants
 defined in ops/invariants.yaml. This prevents drift and repeated failures.
 
 Usage:
-    python3 tools/invariants_check.py
+    python3 tools/invariants_check.py [--fast-fail]
 
 Exit codes:
     0 - All invariants validated successfully
     1 - One or more invariants failed validation
 """
+import argparse
+import functools
+import hashlib
+import json
+import mmap
+import operator
+import os
+import re
 import sys
 import yaml
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from types import MappingProxyType
+from typing import Callable, Dict, List, Any, Mapping, NamedTuple, Optional, Tuple
+
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _Loader
+
+# Shared read-only default for manifest traversals
+_EMPTY = MappingProxyType({})
+
+# Workload kinds whose pod spec lives under spec.template.spec
+_POD_TEMPLATE_KINDS = frozenset({'Job', 'Deployment', 'StatefulSet', 'DaemonSet'})
+
+# Container command/arg strings that invoke repo scripts directly
+_SCRIPTS_RE = re.compile(r'scripts/').search
+_SCRIPTS_COMMAND_MSG = ("K8s manifest {file} references scripts/ in command: {part}. "
+                        "Use 'python3 -m leviathan.module' instead.")
+_SCRIPTS_ARGS_MSG = ("K8s manifest {file} references scripts/ in args: {part}. "
+                     "Use 'python3 -m leviathan.module' instead.")
+
+# Start of a requirement line's version/extras/marker part
+_REQUIREMENT_NAME_END_RE = re.compile(r'[<>=!~;\[ @]')
+# Separator runs folded by PEP 503 name normalization
+_REQUIREMENT_NAME_SEP_RE = re.compile(r'[-_.]+')
+
+# A workflow line that mentions both an image key and a :latest tag
+_LATEST_IMAGE_RE = re.compile(rb'^(?=.*image:).*:latest.*$', re.MULTILINE)
+
+
+def _normalize_requirement_name(name: str) -> str:
+    """PEP 503 normalized project name (lowercase, runs of -_. become -)."""
+    return _REQUIREMENT_NAME_SEP_RE.sub('-', name).lower()
+
+
+def _requirement_names(text: str) -> set:
+    """Normalized project names listed in a requirements file (options like -r are skipped)."""
+    names = set()
+    for line in text.splitlines():
+        line = line.split('#', 1)[0].strip()
+        if not line or line.startswith('-'):
+            continue
+        names.add(_normalize_requirement_name(_REQUIREMENT_NAME_END_RE.split(line, 1)[0]))
+    return names
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _invariants_cache_file(raw: bytes) -> Path:
+    """Cross-run cache entry for invariants.yaml content, under $XDG_CACHE_HOME/leviathan."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    return Path(cache_home) / 'leviathan' / f"invariants-{digest}.json"
+
+
+def _write_invariants_cache(cache_file: Path, invariants: Any):
+    """Store a parse as JSON, atomically; content JSON cannot round-trip is not cached."""
+    try:
+        text = json.dumps(invariants)
+        # Dates, non-string keys, etc. would come back different
+        if json.loads(text) != invariants:
+            return
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp_file.write_text(text)
+        os.replace(tmp_file, cache_file)
+    except (TypeError, ValueError, OSError):
+        pass  # Unserializable content or unwritable cache dir; just parse every run
+
+
+@functools.lru_cache(maxsize=None)
+def _load_invariants_file(path: str, mtime_ns: int, size: int) -> Mapping[str, Any]:
+    """
+    Parse an invariants.yaml, memoized per (path, mtime_ns, size) for the process.
+    
+    Parses are also kept across runs as JSON under $XDG_CACHE_HOME/leviathan
+    (~/.cache/leviathan), keyed by a hash of the file content; an unreadable
+    entry is treated as a miss. The result is shared between checkers, so it
+    is returned deeply frozen (read-only mappings, tuples for lists).
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    
+    cache_file = _invariants_cache_file(raw)
+    try:
+        with open(cache_file, 'rb') as f:
+            return _freeze(json.load(f))
+    except Exception:
+        pass  # Missing, corrupt or unreadable: parse the YAML
+    
+    invariants = yaml.load(raw, Loader=_Loader)
+    _write_invariants_cache(cache_file, invariants)
+    return _freeze(invariants)
+
+
+def _section(title: str, success: str):
+    """
+    Wrap a check_* method with its report header and FAIL/✓ lines.
+    
+    Failures the check adds are logged together once it returns; otherwise a
+    ✓ line is logged. A check may return a string to use as the ✓ text
+    instead of success.
+    """
+    def decorator(check):
+        @functools.wraps(check)
+        def wrapper(self):
+            self._log(f"\n=== Checking {title} ===")
+            before = len(self.failures)
+            result = check(self)
+            new = self.failures[before:]
+            if new:
+                self._log('\n'.join(f"FAIL: {message}" for message in new))
+            else:
+                self._log(f"✓ {result or success}")
+        return wrapper
+    return decorator
+
+
+class _Rule(NamedTuple):
+    """One declarative manifest check: value at keys vs. an invariant field."""
+    keys: Tuple[str, ...]
+    field: Optional[str]
+    check: Callable[[Any, Any], bool]
+    message: str
+    default: Any = None
+
+
+def _rule(path: str, field: Optional[str], check: Callable[[Any, Any], bool],
+          message: str, default: Any = None) -> _Rule:
+    """Build a _Rule from a dotted path; message may use {expected} and {actual}."""
+    return _Rule(tuple(path.split('.')), field, check, message, default)
+
+
+def _walk(doc: Any, keys: Tuple[str, ...], default: Any = None) -> Any:
+    """
+    Follow keys through nested mappings, returning default on any miss.
+    
+    Replaces .get(k, {}).get(...) chains without allocating empty dicts
+    along the way.
+    """
+    for key in keys:
+        if not isinstance(doc, dict):
+            return default
+        doc = doc.get(key, _EMPTY)
+        if doc is _EMPTY:
+            return default
+    return doc
+
+
+def _no_latest_tag(actual: str, _expected: Any) -> bool:
+    """Rule check: the image reference is not tagged :latest."""
+    return ':latest' not in actual
+
+
+# Rule tables, applied to the first container, the Deployment/Job, and the Service
+_CP_CONTAINER_RULES = (
+    _rule('name', 'container_name', operator.eq,
+          "Control plane container name must be '{expected}', got '{actual}'"),
+    _rule('image', 'image_name', str.startswith,
+          "Control plane image must start with '{expected}', got '{actual}'", default=''),
+    _rule('image', None, _no_latest_tag,
+          "Control plane image uses forbidden ':latest' tag: {actual}", default=''),
+)
+_CP_DEPLOYMENT_RULES = (
+    _rule('metadata.labels.app', 'app_label', operator.eq,
+          "Control plane deployment label 'app' must be '{expected}', got '{actual}'"),
+    _rule('spec.selector.matchLabels.app', 'selector_app', operator.eq,
+          "Control plane selector 'app' must be '{expected}', got '{actual}'"),
+)
+_CP_SERVICE_RULES = (
+    _rule('metadata.name', 'service_name', operator.eq,
+          "Control plane service name must be '{expected}', got '{actual}'"),
+    _rule('spec.selector.app', 'selector_app', operator.eq,
+          "Control plane service selector 'app' must be '{expected}', got '{actual}'"),
+)
+_CP_SERVICE_PORT_RULES = (
+    _rule('port', 'port', operator.eq,
+          "Control plane service port must be {expected}, got {actual}"),
+)
+_WORKER_CONTAINER_RULES = (
+    _rule('name', 'container_name', operator.eq,
+          "Worker container name must be '{expected}', got '{actual}'"),
+    _rule('image', 'image_name', str.startswith,
+          "Worker image must start with '{expected}', got '{actual}'", default=''),
+    _rule('image', None, _no_latest_tag,
+          "Worker image uses forbidden ':latest' tag: {actual}", default=''),
+)
+_WORKER_JOB_RULES = (
+    _rule('metadata.labels.app', 'app_label', operator.eq,
+          "Worker job label 'app' must be '{expected}', got '{actual}'"),
+)
+
+
+class _ControlPlaneInvariants(NamedTuple):
+    """Control plane values from kubernetes.control_plane, resolved once."""
+    container_name: str
+    image_name: str
+    app_label: str
+    selector_app: str
+    service_name: str
+    port: int
+
+
+class _WorkerInvariants(NamedTuple):
+    """Worker values from kubernetes.worker and secrets.worker, resolved once."""
+    container_name: str
+    image_name: str
+    app_label: str
+    required_env_vars: List[str]
 
 
 class InvariantsChecker:
     """Validates repository files against canonical invariants."""
     
-    def __init__(self, repo_root: Path):
+    # Checks in report order; run_all_checks() runs each through _run_check()
+    CHECKS = (
+        'check_k8s_control_plane',
+        'check_k8s_worker_job',
+        'check_ci_workflows',
+        'check_requirements',
+        'check_namespace_consistency',
+        'check_topology_artifacts',
+        'check_topology_api_endpoints',
+        'check_failover_documentation',
+        'check_failover_backends',
+        'check_k8s_packaging',
+        'check_autonomy_config',
+        'check_scheduler_manifest',
+        'check_spider_manifests',
+        'check_console_manifests',
+        'check_kustomize_structure',
+        'check_documentation_invariants',
+        'check_control_plane_autonomy_mount',
+    )
+    
+    def __init__(self, repo_root: Path, fast_fail: bool = False):
         self.repo_root = repo_root
+        # Stop at the first check that records a failure
+        self.fast_fail = fast_fail
         self.invariants = self._load_invariants()
         self.failures: List[str] = []
+        # Report lines; run_all_checks() writes them to stdout in one call
+        self._out: List[str] = []
+        self._discover_files()
+        # Several checks read the same manifests/sources; parse and read each file
+        # once. The caches live only as long as this checker (one gate run), so
+        # an edited file is picked up by the next checker without invalidation.
+        self._yaml_cache: Dict[Path, List[Any]] = {}  # parsed YAML documents
+        self._bytes_cache: Dict[Path, bytes] = {}  # raw file contents
+        self._text_cache: Dict[Path, str] = {}  # UTF-8 decode of _bytes_cache
+        self._kind_cache: Dict[Path, Dict[Any, List[Dict]]] = {}  # _yaml_cache docs by kind
+        # Source files scanned as bytes; closed by close()
+        self._mmap_cache: Dict[Path, Any] = {}
     
-    def _load_invariants(self) -> Dict[str, Any]:
+    def _load_invariants(self) -> Mapping[str, Any]:
         """Load invariants from ops/invariants.yaml."""
         invariants_path = self.repo_root / "ops" / "invariants.yaml"
         
@@ -34,18 +292,190 @@ class InvariantsChecker:
             print(f"ERROR: Invariants file not found: {invariants_path}")
             sys.exit(1)
         
-        with open(invariants_path, 'r') as f:
-            return yaml.safe_load(f)
+        stat = invariants_path.stat()
+        return _load_invariants_file(str(invariants_path), stat.st_mtime_ns, stat.st_size)
+    
+    @functools.cached_property
+    def _cp(self) -> _ControlPlaneInvariants:
+        """Control plane invariants (KeyError if the section is incomplete)."""
+        cp_inv = self.invariants['kubernetes']['control_plane']
+        return _ControlPlaneInvariants(
+            container_name=cp_inv['container_name'],
+            image_name=cp_inv['image_name'],
+            app_label=cp_inv['labels']['app'],
+            selector_app=cp_inv['selectors']['app'],
+            service_name=cp_inv['service_name'],
+            port=cp_inv['port'],
+        )
+    
+    @functools.cached_property
+    def _worker(self) -> _WorkerInvariants:
+        """Worker job invariants (KeyError if the sections are incomplete)."""
+        worker_inv = self.invariants['kubernetes']['worker']
+        return _WorkerInvariants(
+            container_name=worker_inv['container_name'],
+            image_name=worker_inv['image_name'],
+            app_label=worker_inv['job_labels']['app'],
+            required_env_vars=self.invariants['secrets']['worker']['required_env_vars'],
+        )
+    
+    @functools.cached_property
+    def _topo_inv(self) -> Dict[str, Any]:
+        """Topology section of the invariants (empty if absent)."""
+        return self.invariants.get('topology', {})
+    
+    @functools.cached_property
+    def _failover_inv(self) -> Dict[str, Any]:
+        """Failover section of the invariants (empty if absent)."""
+        return self.invariants.get('failover', {})
+    
+    @staticmethod
+    def _missing_needles(content: Any, needles: List[str]) -> List[str]:
+        """
+        Return needles that do not occur in a bytes-like content, in input order.
+        
+        One regex alternation pass finds most needles; a needle it misses
+        (e.g. only occurring inside a longer, already-matched needle) is
+        confirmed with a plain find().
+        """
+        encoded = {n: n.encode() for n in needles}
+        alternatives = sorted(set(encoded.values()), key=len, reverse=True)
+        found = set(re.compile(b'|'.join(re.escape(e) for e in alternatives)).findall(content))
+        return [n for n in needles if encoded[n] not in found and content.find(encoded[n]) == -1]
+    
+    def _mmap_bytes(self, path: Path) -> Any:
+        """Map a source or workflow file read-only (cached per path) for byte-level scans."""
+        mm = self._mmap_cache.get(path)
+        if mm is None:
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                size = os.fstat(fd).st_size
+                # mmap rejects zero-length files
+                mm = mmap.mmap(fd, size, access=mmap.ACCESS_READ) if size else b''
+            finally:
+                os.close(fd)
+            self._mmap_cache[path] = mm
+        return mm
+    
+    def close(self):
+        """Release mapped source files."""
+        for mm in self._mmap_cache.values():
+            if isinstance(mm, mmap.mmap):
+                mm.close()
+        self._mmap_cache.clear()
+    
+    def _apply_rules(self, doc: Dict, rules: Tuple[_Rule, ...], inv: Any):
+        """Fail every rule whose value in doc does not satisfy its check against inv."""
+        for rule in rules:
+            actual = _walk(doc, rule.keys, rule.default)
+            expected = getattr(inv, rule.field) if rule.field else None
+            if not rule.check(actual, expected):
+                self.fail(rule.message.format(expected=expected, actual=actual))
+    
+    @staticmethod
+    def _pod_spec(doc: Dict) -> Any:
+        """Return a manifest's pod spec (spec.template.spec for workloads, spec for Pods)."""
+        spec = doc.get('spec', _EMPTY)
+        if doc.get('kind') in _POD_TEMPLATE_KINDS:
+            return spec.get('template', _EMPTY).get('spec', _EMPTY)
+        return spec
+    
+    def _discover_files(self):
+        """List ops/k8s YAML manifests and workflow files once for all checks."""
+        self._k8s_yaml_files: List[Path] = []
+        for dirpath, dirnames, filenames in os.walk(self.repo_root / "ops" / "k8s"):
+            dirnames.sort()
+            self._k8s_yaml_files.extend(
+                Path(dirpath) / name for name in sorted(filenames) if name.endswith('.yaml')
+            )
+        # Parallel str forms for the per-manifest packaging loop
+        self._k8s_yaml_files_str: List[str] = [str(p) for p in self._k8s_yaml_files]
+        self._k8s_yaml_names: List[str] = [p.name for p in self._k8s_yaml_files]
+        
+        workflows_dir = self.repo_root / ".github" / "workflows"
+        try:
+            entries = sorted(os.scandir(workflows_dir), key=lambda e: e.name)
+        except FileNotFoundError:
+            entries = []
+        self._workflow_files: List[Path] = [
+            workflows_dir / e.name for e in entries if e.name.endswith('.yml') and e.is_file()
+        ]
+    
+    def _k8s_yaml_in(self, directory: Path) -> List[Path]:
+        """YAML manifests directly inside directory (an ops/k8s subtree)."""
+        return [p for p in self._k8s_yaml_files if p.parent == directory]
+    
+    def _load_yaml_docs(self, path: Path) -> List[Any]:
+        """Parse all YAML documents in a file, caching the result per path."""
+        docs = self._yaml_cache.get(path)
+        if docs is None:
+            with open(path, 'rb') as f:
+                docs = list(yaml.load_all(f, Loader=_Loader))
+            self._yaml_cache[path] = docs
+        return docs
+    
+    def _docs_by_kind(self, path: Path) -> Dict[Any, List[Dict]]:
+        """Index a file's YAML documents by kind (file order kept), cached per path."""
+        by_kind = self._kind_cache.get(path)
+        if by_kind is None:
+            by_kind = {}
+            for doc in self._load_yaml_docs(path):
+                if isinstance(doc, dict):
+                    by_kind.setdefault(doc.get('kind'), []).append(doc)
+            self._kind_cache[path] = by_kind
+        return by_kind
+    
+    def _load_yaml_doc(self, path: Path) -> Any:
+        """Parse a single-document YAML file (None if empty), sharing _load_yaml_docs' cache."""
+        docs = self._load_yaml_docs(path)
+        return docs[0] if docs else None
+    
+    def _read_bytes(self, path: Path) -> bytes:
+        """Read a file's raw bytes, caching them per path for every later reader."""
+        data = self._bytes_cache.get(path)
+        if data is None:
+            data = path.read_bytes()
+            self._bytes_cache[path] = data
+        return data
+    
+    def _read_text(self, path: Path) -> str:
+        """Read a UTF-8 text file through the _read_bytes cache, caching the decoded text."""
+        text = self._text_cache.get(path)
+        if text is None:
+            text = self._read_bytes(path).decode('utf-8')
+            self._text_cache[path] = text
+        return text
+    
+    def _log(self, line: str):
+        """Buffer a report line for the final stdout write."""
+        self._out.append(f"{line}\n")
+    
+    def _run_check(self, name: str) -> List[str]:
+        """
+        Run one check, recording an exception it raises as a failure.
+        
+        The check's output up to the exception is kept, so one broken
+        section does not lose the rest of the report.
+        
+        Returns:
+            Failures added by the check
+        """
+        before = len(self.failures)
+        try:
+            getattr(self, name)()
+        except Exception as e:
+            # The section's own FAIL lines were never logged
+            self.fail(f"{name} crashed: {e}")
+            self._log('\n'.join(f"FAIL: {message}" for message in self.failures[before:]))
+        return self.failures[before:]
     
     def fail(self, message: str):
-        """Record a validation failure."""
+        """Record a validation failure (reported when the check's section ends)."""
         self.failures.append(message)
-        print(f"FAIL: {message}")
     
+    @_section("Control Plane K8s Manifests", "Control plane manifests valid")
     def check_k8s_control_plane(self):
         """Validate control plane Kubernetes manifests."""
-        print("\n=== Checking Control Plane K8s Manifests ===")
-        
         k8s_dir = self.repo_root / "ops" / "k8s"
         control_plane_yaml = k8s_dir / "control-plane.yaml"
         
@@ -53,113 +483,68 @@ class InvariantsChecker:
             self.fail(f"Control plane manifest not found: {control_plane_yaml}")
             return
         
-        with open(control_plane_yaml, 'r') as f:
-            docs = list(yaml.safe_load_all(f))
+        by_kind = self._docs_by_kind(control_plane_yaml)
         
-        cp_inv = self.invariants['kubernetes']['control_plane']
+        cp = self._cp
         
         # Check Deployment
-        deployment = next((d for d in docs if d.get('kind') == 'Deployment'), None)
+        deployment = by_kind.get('Deployment', [None])[0]
         if deployment:
             # Check container name and image
-            containers = deployment.get('spec', {}).get('template', {}).get('spec', {}).get('containers', [])
+            containers = self._pod_spec(deployment).get('containers', ())
             if containers:
-                container = containers[0]
-                
-                if container.get('name') != cp_inv['container_name']:
-                    self.fail(f"Control plane container name must be '{cp_inv['container_name']}', got '{container.get('name')}'")
-                
-                image = container.get('image', '')
-                if not image.startswith(cp_inv['image_name']):
-                    self.fail(f"Control plane image must start with '{cp_inv['image_name']}', got '{image}'")
-                
-                # Check for forbidden :latest tag
-                if ':latest' in image:
-                    self.fail(f"Control plane image uses forbidden ':latest' tag: {image}")
-            
-            # Check labels
-            labels = deployment.get('metadata', {}).get('labels', {})
-            if labels.get('app') != cp_inv['labels']['app']:
-                self.fail(f"Control plane deployment label 'app' must be '{cp_inv['labels']['app']}', got '{labels.get('app')}'")
+                self._apply_rules(containers[0], _CP_CONTAINER_RULES, cp)
             
-            # Check selector
-            selector = deployment.get('spec', {}).get('selector', {}).get('matchLabels', {})
-            if selector.get('app') != cp_inv['selectors']['app']:
-                self.fail(f"Control plane selector 'app' must be '{cp_inv['selectors']['app']}', got '{selector.get('app')}'")
+            # Check labels and selector
+            self._apply_rules(deployment, _CP_DEPLOYMENT_RULES, cp)
         else:
             self.fail("Control plane Deployment not found in manifest")
         
         # Check Service
-        service = next((d for d in docs if d.get('kind') == 'Service'), None)
+        service = by_kind.get('Service', [None])[0]
         if service:
-            if service.get('metadata', {}).get('name') != cp_inv['service_name']:
-                self.fail(f"Control plane service name must be '{cp_inv['service_name']}', got '{service.get('metadata', {}).get('name')}'")
+            self._apply_rules(service, _CP_SERVICE_RULES, cp)
             
-            ports = service.get('spec', {}).get('ports', [])
-            if ports and ports[0].get('port') != cp_inv['port']:
-                self.fail(f"Control plane service port must be {cp_inv['port']}, got {ports[0].get('port')}")
-            
-            selector = service.get('spec', {}).get('selector', {})
-            if selector.get('app') != cp_inv['selectors']['app']:
-                self.fail(f"Control plane service selector 'app' must be '{cp_inv['selectors']['app']}', got '{selector.get('app')}'")
+            ports = _walk(service, ('spec', 'ports'), ())
+            if ports:
+                self._apply_rules(ports[0], _CP_SERVICE_PORT_RULES, cp)
         else:
             self.fail("Control plane Service not found in manifest")
-        
-        if not self.failures:
-            print("✓ Control plane manifests valid")
     
+    @_section("Worker Job Template", "Worker job template valid")
     def check_k8s_worker_job(self):
         """Validate worker job template."""
-        print("\n=== Checking Worker Job Template ===")
-        
         job_template = self.repo_root / "ops" / "k8s" / "job-template.yaml"
         
         if not job_template.exists():
             self.fail(f"Worker job template not found: {job_template}")
             return
         
-        with open(job_template, 'r') as f:
-            job = yaml.safe_load(f)
+        job = self._load_yaml_doc(job_template)
         
-        worker_inv = self.invariants['kubernetes']['worker']
-        secrets_inv = self.invariants['secrets']['worker']
+        worker = self._worker
         
-        # Check container name and image
-        containers = job.get('spec', {}).get('template', {}).get('spec', {}).get('containers', [])
+        # Check container name and image (job-template.yaml is always a Job
+        # template, so read spec.template.spec whatever kind it declares)
+        containers = _walk(job, ('spec', 'template', 'spec', 'containers'), ())
         if containers:
             container = containers[0]
-            
-            if container.get('name') != worker_inv['container_name']:
-                self.fail(f"Worker container name must be '{worker_inv['container_name']}', got '{container.get('name')}'")
-            
-            image = container.get('image', '')
-            if not image.startswith(worker_inv['image_name']):
-                self.fail(f"Worker image must start with '{worker_inv['image_name']}', got '{image}'")
-            
-            # Check for forbidden :latest tag
-            if ':latest' in image:
-                self.fail(f"Worker image uses forbidden ':latest' tag: {image}")
+            self._apply_rules(container, _WORKER_CONTAINER_RULES, worker)
             
             # Check required environment variables
-            env_vars = {e.get('name'): e for e in container.get('env', [])}
-            for required_var in secrets_inv['required_env_vars']:
-                if required_var not in env_vars:
+            env_names = {e.get('name') for e in container.get('env') or ()}
+            for required_var in worker.required_env_vars:
+                if required_var not in env_names:
                     self.fail(f"Worker job template missing required env var: {required_var}")
         else:
             self.fail("Worker container not found in job template")
         
         # Check job labels
-        labels = job.get('metadata', {}).get('labels', {})
-        if labels.get('app') != worker_inv['job_labels']['app']:
-            self.fail(f"Worker job label 'app' must be '{worker_inv['job_labels']['app']}', got '{labels.get('app')}'")
-        
-        if not self.failures:
-            print("✓ Worker job template valid")
+        self._apply_rules(job, _WORKER_JOB_RULES, worker)
     
+    @_section("CI Workflows", "CI workflows valid")
     def check_ci_workflows(self):
         """Validate GitHub Actions workflows."""
-        print("\n=== Checking CI Workflows ===")
-        
         workflows_dir = self.repo_root / ".github" / "workflows"
         
         if not workflows_dir.exists():
@@ -171,24 +556,28 @@ class InvariantsChecker:
         # Check main CI workflow
         ci_yaml = workflows_dir / "ci.yml"
         if ci_yaml.exists():
-            with open(ci_yaml, 'r') as f:
-                ci_workflow = yaml.safe_load(f)
-            
-            # Check for invariants_check step
-            jobs = ci_workflow.get('jobs', {})
             has_invariants_check = False
             has_pytest = False
             
-            for job_name, job_config in jobs.items():
-                steps = job_config.get('steps', [])
-                for step in steps:
-                    run_cmd = step.get('run', '')
-                    
-                    if 'invariants_check' in run_cmd or 'tools/invariants_check.py' in run_cmd:
-                        has_invariants_check = True
-                    
-                    if 'pytest' in run_cmd:
-                        has_pytest = True
+            # A step can only run a command named somewhere in the file, so parse
+            # ci.yml only when a marker is present (the mapping is reused below)
+            data = self._mmap_bytes(ci_yaml)
+            if data.find(b'invariants_check') != -1 or data.find(b'pytest') != -1:
+                ci_workflow = self._load_yaml_doc(ci_yaml)
+                
+                # Check for invariants_check step
+                jobs = ci_workflow.get('jobs', {})
+                
+                for job_name, job_config in jobs.items():
+                    steps = job_config.get('steps', [])
+                    for step in steps:
+                        run_cmd = step.get('run', '')
+                        
+                        if 'invariants_check' in run_cmd or 'tools/invariants_check.py' in run_cmd:
+                            has_invariants_check = True
+                        
+                        if 'pytest' in run_cmd:
+                            has_pytest = True
             
             if not has_invariants_check:
                 self.fail("CI workflow must run invariants_check.py")
@@ -199,67 +588,56 @@ class InvariantsChecker:
             self.fail(f"CI workflow not found: {ci_yaml}")
         
         # Check all workflows for :latest tag usage
-        for workflow_file in workflows_dir.glob("*.yml"):
-            with open(workflow_file, 'r') as f:
-                content = f.read()
-                if ':latest' in content and 'image:' in content:
-                    # Check if it's actually an image reference
-                    for line in content.split('\n'):
-                        if 'image:' in line and ':latest' in line:
-                            self.fail(f"Workflow {workflow_file.name} contains forbidden ':latest' image tag: {line.strip()}")
-        
-        if not self.failures:
-            print("✓ CI workflows valid")
+        for workflow_file in self._workflow_files:
+            data = self._mmap_bytes(workflow_file)
+            # Most workflows are clean; skip the line scan unless both markers appear
+            if data.find(b':latest') == -1 or data.find(b'image:') == -1:
+                continue
+            for match in _LATEST_IMAGE_RE.finditer(data):
+                line = match.group().decode('utf-8', 'replace').strip()
+                self.fail(f"Workflow {workflow_file.name} contains forbidden ':latest' image tag: {line}")
     
+    @_section("Requirements", "Requirements valid")
     def check_requirements(self):
         """Validate requirements files contain necessary dependencies."""
-        print("\n=== Checking Requirements ===")
-        
         req_dev = self.repo_root / "requirements-dev.txt"
         
         if not req_dev.exists():
             self.fail(f"requirements-dev.txt not found: {req_dev}")
             return
         
-        with open(req_dev, 'r') as f:
-            requirements = f.read().lower()
+        req_names = _requirement_names(self._read_text(req_dev))
         
         ci_inv = self.invariants['ci']
         for dep in ci_inv['required_dependencies']:
-            if dep.lower() not in requirements:
+            if _normalize_requirement_name(dep) not in req_names:
                 self.fail(f"requirements-dev.txt missing required dependency: {dep}")
-        
-        if not self.failures:
-            print("✓ Requirements valid")
     
+    @_section("Namespace Consistency", "Namespace consistency valid")
     def check_namespace_consistency(self):
         """Validate namespace is consistent across all K8s manifests."""
-        print("\n=== Checking Namespace Consistency ===")
-        
         k8s_dir = self.repo_root / "ops" / "k8s"
         expected_namespace = self.invariants['kubernetes']['namespace']
         
-        for yaml_file in k8s_dir.glob("*.yaml"):
-            with open(yaml_file, 'r') as f:
-                try:
-                    docs = list(yaml.safe_load_all(f))
-                    for doc in docs:
-                        if doc and isinstance(doc, dict):
-                            namespace = doc.get('metadata', {}).get('namespace')
-                            if namespace and namespace != expected_namespace:
-                                self.fail(f"{yaml_file.name}: namespace must be '{expected_namespace}', got '{namespace}'")
-                except yaml.YAMLError as e:
-                    self.fail(f"Failed to parse {yaml_file.name}: {e}")
-        
-        if not self.failures:
-            print("✓ Namespace consistency valid")
+        for yaml_file in self._k8s_yaml_in(k8s_dir):
+            try:
+                docs = self._load_yaml_docs(yaml_file)
+            except yaml.YAMLError as e:
+                self.fail(f"Failed to parse {yaml_file.name}: {e}")
+                continue
+            
+            for doc in docs:
+                if doc and isinstance(doc, dict):
+                    namespace = _walk(doc, ('metadata', 'namespace'))
+                    if namespace and namespace != expected_namespace:
+                        self.fail(f"{yaml_file.name}: namespace must be '{expected_namespace}', got '{namespace}'")
     
+    @_section("Topology Artifacts", "Topology artifacts valid")
     def check_topology_artifacts(self):
         """Validate topology artifact names are defined."""
-        print("\n=== Checking Topology Artifacts ===")
-        
-        topo_inv = self.invariants.get('topology', {})
-        artifact_names = topo_inv.get('artifact_names', [])
+        artifact_names = self._topo_inv.get('artifact_names', [])
+        if not artifact_names:
+            return "Topology artifacts valid (no invariants configured)"
         
         # Check that artifact names are referenced in topology indexer
         indexer_file = self.repo_root / "leviathan" / "topology" / "indexer.py"
@@ -268,22 +646,17 @@ class InvariantsChecker:
             self.fail("Topology indexer not found: leviathan/topology/indexer.py")
             return
         
-        with open(indexer_file, 'r') as f:
-            content = f.read()
+        content = self._mmap_bytes(indexer_file)
         
-        for artifact_name in artifact_names:
-            if artifact_name not in content:
-                self.fail(f"Topology artifact '{artifact_name}' not found in indexer code")
-        
-        if not self.failures:
-            print("✓ Topology artifacts valid")
+        for artifact_name in self._missing_needles(content, artifact_names):
+            self.fail(f"Topology artifact '{artifact_name}' not found in indexer code")
     
+    @_section("Topology API Endpoints", "Topology API endpoints valid")
     def check_topology_api_endpoints(self):
         """Validate topology API endpoints exist."""
-        print("\n=== Checking Topology API Endpoints ===")
-        
-        topo_inv = self.invariants.get('topology', {})
-        endpoints = topo_inv.get('api_endpoints', [])
+        endpoints = self._topo_inv.get('api_endpoints', [])
+        if not endpoints:
+            return "Topology API endpoints valid (no invariants configured)"
         
         # Check that endpoints are defined in control plane API
         api_file = self.repo_root / "leviathan" / "control_plane" / "api.py"
@@ -292,159 +665,124 @@ class InvariantsChecker:
             self.fail("Control plane API not found: leviathan/control_plane/api.py")
             return
         
-        with open(api_file, 'r') as f:
-            content = f.read()
+        content = self._mmap_bytes(api_file)
         
-        for endpoint in endpoints:
-            # Check for @app.get decorator with endpoint path
-            if f'@app.get("{endpoint}"' not in content:
-                self.fail(f"Topology API endpoint '{endpoint}' not found in control plane")
-        
-        if not self.failures:
-            print("✓ Topology API endpoints valid")
+        # Check for @app.get decorator with endpoint path
+        decorators = {f'@app.get("{endpoint}"': endpoint for endpoint in endpoints}
+        for decorator in self._missing_needles(content, list(decorators)):
+            self.fail(f"Topology API endpoint '{decorators[decorator]}' not found in control plane")
     
+    @_section("Failover Documentation", "Failover documentation valid")
     def check_failover_documentation(self):
         """Validate failover documentation exists."""
-        print("\n=== Checking Failover Documentation ===")
-        
-        failover_inv = self.invariants.get('failover', {})
-        docs = failover_inv.get('documentation', [])
+        docs = self._failover_inv.get('documentation', [])
+        if not docs:
+            return "Failover documentation valid (no invariants configured)"
         
         for doc_path in docs:
             doc_file = self.repo_root / doc_path
             if not doc_file.exists():
                 self.fail(f"Failover documentation not found: {doc_path}")
-        
-        if not self.failures:
-            print("✓ Failover documentation valid")
     
+    @_section("Failover Backends", "Failover backends valid")
     def check_failover_backends(self):
         """Validate failover backend implementations exist."""
-        print("\n=== Checking Failover Backends ===")
-        
-        failover_inv = self.invariants.get('failover', {})
-        backends = failover_inv.get('backends', {})
+        backends = self._failover_inv.get('backends', {})
         
-        # Check artifact store backends
+        # Check artifact store backends (store.py is only read if some are required)
         artifact_backends = backends.get('artifact_store', [])
         artifact_store_file = self.repo_root / "leviathan" / "artifacts" / "store.py"
         
-        if artifact_store_file.exists():
-            with open(artifact_store_file, 'r') as f:
-                content = f.read()
+        if artifact_backends and not artifact_store_file.exists():
+            self.fail("Artifact store file not found")
+        elif artifact_backends:
+            content = self._mmap_bytes(artifact_store_file)
             
             for backend in artifact_backends:
                 if backend == 'file':
-                    if 'class FileBackend' not in content:
+                    if content.find(b'class FileBackend') == -1:
                         self.fail(f"FileBackend not found in artifact store")
                 elif backend == 's3':
-                    if 'class S3Backend' not in content:
+                    if content.find(b'class S3Backend') == -1:
                         self.fail(f"S3Backend not found in artifact store")
-        else:
-            self.fail("Artifact store file not found")
         
         # Check event store backends
         event_backends = backends.get('event_store', [])
         events_file = self.repo_root / "leviathan" / "graph" / "events.py"
         
-        if events_file.exists():
-            with open(events_file, 'r') as f:
-                content = f.read()
+        if event_backends and not events_file.exists():
+            self.fail("Event store file not found")
+        elif event_backends:
+            content = self._mmap_bytes(events_file)
             
             for backend in event_backends:
                 if backend == 'ndjson':
-                    if '_append_ndjson' not in content:
+                    if content.find(b'_append_ndjson') == -1:
                         self.fail(f"NDJSON backend not found in event store")
                 elif backend == 'postgres':
-                    if '_append_postgres' not in content:
+                    if content.find(b'_append_postgres') == -1:
                         self.fail(f"Postgres backend not found in event store")
-        else:
-            self.fail("Event store file not found")
-        
-        if not self.failures:
-            print("✓ Failover backends valid")
     
+    @_section("K8s Packaging Invariants", "K8s packaging invariants valid")
     def check_k8s_packaging(self):
         """Validate K8s manifests don't reference non-packaged scripts."""
-        print("\n=== Checking K8s Packaging Invariants ===")
-        
-        k8s_dir = self.repo_root / "ops" / "k8s"
-        
-        # Find all YAML files in k8s directory
-        yaml_files = list(k8s_dir.glob("**/*.yaml"))
-        
-        for yaml_file in yaml_files:
-            with open(yaml_file, 'r') as f:
-                try:
-                    docs = list(yaml.safe_load_all(f))
-                except yaml.YAMLError:
-                    continue
+        # All YAML files in the k8s directory, with their str path and name
+        yaml_files = zip(self._k8s_yaml_files, self._k8s_yaml_files_str, self._k8s_yaml_names)
+        
+        for yaml_file, yaml_path, yaml_name in yaml_files:
+            try:
+                docs = self._load_yaml_docs(yaml_file)
+            except yaml.YAMLError:
+                continue
+            
+            # Job runtime invariants only apply to manifests under ops/k8s/jobs/
+            in_jobs = 'jobs' in yaml_path
             
             for doc in docs:
                 if not doc:
                     continue
                 
                 # Check Job and Pod specs for command/args referencing scripts/
-                self._check_container_commands(doc, yaml_file)
+                self._check_container_commands(doc, yaml_name)
                 
                 # Check namespace and image pull policy for Jobs
-                self._check_job_runtime_invariants(doc, yaml_file)
-        
-        print("✓ K8s packaging invariants valid")
+                if in_jobs:
+                    self._check_job_runtime_invariants(doc, yaml_name)
     
-    def _check_container_commands(self, doc: Dict, yaml_file: Path):
+    def _check_container_commands(self, doc: Dict, yaml_name: str):
         """Check container commands/args for forbidden script references."""
         if doc.get('kind') not in ['Job', 'Pod', 'Deployment', 'StatefulSet', 'DaemonSet']:
             return
         
-        # Get containers from spec
-        spec = doc.get('spec', {})
-        
-        # Handle Job template
-        if doc.get('kind') == 'Job':
-            spec = spec.get('template', {}).get('spec', {})
-        # Handle Deployment/StatefulSet/DaemonSet template
-        elif doc.get('kind') in ['Deployment', 'StatefulSet', 'DaemonSet']:
-            spec = spec.get('template', {}).get('spec', {})
-        
-        containers = spec.get('containers', [])
+        containers = self._pod_spec(doc).get('containers', ())
         
         for container in containers:
             # Check command
-            command = container.get('command', [])
-            for cmd_part in command:
-                if isinstance(cmd_part, str) and 'scripts/' in cmd_part:
-                    self.fail(f"K8s manifest {yaml_file.name} references scripts/ in command: {cmd_part}. "
-                             f"Use 'python3 -m leviathan.module' instead.")
+            for cmd_part in container.get('command', ()):
+                if type(cmd_part) is str and _SCRIPTS_RE(cmd_part):
+                    self.fail(_SCRIPTS_COMMAND_MSG.format(file=yaml_name, part=cmd_part))
             
             # Check args
-            args = container.get('args', [])
-            for arg in args:
-                if isinstance(arg, str) and 'scripts/' in arg:
-                    self.fail(f"K8s manifest {yaml_file.name} references scripts/ in args: {arg}. "
-                             f"Use 'python3 -m leviathan.module' instead.")
-    
-    def _check_job_runtime_invariants(self, doc: Dict, yaml_file: Path):
-        """Check Job namespace and image pull policy invariants."""
+            for arg in container.get('args', ()):
+                if type(arg) is str and _SCRIPTS_RE(arg):
+                    self.fail(_SCRIPTS_ARGS_MSG.format(file=yaml_name, part=arg))
+    
+    def _check_job_runtime_invariants(self, doc: Dict, yaml_name: str):
+        """Check Job namespace and image pull policy invariants (callers pass only ops/k8s/jobs/ manifests)."""
         if doc.get('kind') != 'Job':
             return
         
-        # Check if this is a Job in ops/k8s/jobs/
-        if 'jobs' not in str(yaml_file):
-            return
-        
         # Check namespace
-        namespace = doc.get('metadata', {}).get('namespace')
+        namespace = _walk(doc, ('metadata', 'namespace'))
         if namespace == 'default':
-            self.fail(f"K8s Job {yaml_file.name} uses namespace 'default'. "
+            self.fail(f"K8s Job {yaml_name} uses namespace 'default'. "
                      f"Jobs must specify namespace: leviathan")
         elif not namespace:
-            self.fail(f"K8s Job {yaml_file.name} missing namespace. "
+            self.fail(f"K8s Job {yaml_name} missing namespace. "
                      f"Jobs must specify namespace: leviathan")
         
         # Check image pull policy for local images
-        spec = doc.get('spec', {}).get('template', {}).get('spec', {})
-        containers = spec.get('containers', [])
+        containers = self._pod_spec(doc).get('containers', ())
         
         for container in containers:
             image = container.get('image', '')
@@ -453,22 +791,20 @@ class InvariantsChecker:
             # If using local leviathan image, must have IfNotPresent
             if image.startswith('leviathan-') and ':local' in image:
                 if pull_policy != 'IfNotPresent':
-                    self.fail(f"K8s Job {yaml_file.name} container '{container.get('name')}' "
+                    self.fail(f"K8s Job {yaml_name} container '{container.get('name')}' "
                              f"uses local image '{image}' but imagePullPolicy is '{pull_policy}'. "
                              f"Must be 'IfNotPresent' for local images.")
     
+    @_section("Autonomy Configuration", "Autonomy configuration valid")
     def check_autonomy_config(self):
         """Validate DEV autonomy configuration."""
-        print("\n=== Checking Autonomy Configuration ===")
-        
         autonomy_config = self.repo_root / "ops" / "autonomy" / "dev.yaml"
         
         if not autonomy_config.exists():
             self.fail("DEV autonomy config not found: ops/autonomy/dev.yaml")
             return
         
-        with open(autonomy_config, 'r') as f:
-            config = yaml.safe_load(f)
+        config = self._load_yaml_doc(autonomy_config)
         
         # Check required fields
         required_fields = [
@@ -492,20 +828,17 @@ class InvariantsChecker:
         if 'max_open_prs' in config:
             if config['max_open_prs'] < 1:
                 self.fail("Autonomy config max_open_prs must be >= 1")
-        
-        print("✓ Autonomy configuration valid")
     
+    @_section("Scheduler Manifest", "Scheduler manifest valid")
     def check_scheduler_manifest(self):
         """Validate scheduler K8s manifest exists."""
-        print("\n=== Checking Scheduler Manifest ===")
-        
         scheduler_dir = self.repo_root / "ops" / "k8s" / "scheduler"
         
         if not scheduler_dir.exists():
             self.fail("Scheduler manifest directory not found: ops/k8s/scheduler/")
             return
         
-        yaml_files = list(scheduler_dir.glob("*.yaml"))
+        yaml_files = self._k8s_yaml_in(scheduler_dir)
         
         if not yaml_files:
             self.fail("No scheduler manifests found in ops/k8s/scheduler/")
@@ -514,40 +847,33 @@ class InvariantsChecker:
         # Check at least one manifest has CronJob or Deployment
         found_scheduler = False
         for yaml_file in yaml_files:
-            with open(yaml_file, 'r') as f:
-                try:
-                    docs = list(yaml.safe_load_all(f))
-                except yaml.YAMLError:
-                    continue
+            try:
+                by_kind = self._docs_by_kind(yaml_file)
+            except yaml.YAMLError:
+                continue
             
-            for doc in docs:
-                if not doc:
-                    continue
-                
-                if doc.get('kind') in ['CronJob', 'Deployment']:
+            for kind in ('CronJob', 'Deployment'):
+                for doc in by_kind.get(kind, ()):
                     found_scheduler = True
                     
                     # Check namespace
-                    namespace = doc.get('metadata', {}).get('namespace')
+                    namespace = _walk(doc, ('metadata', 'namespace'))
                     if namespace != 'leviathan':
                         self.fail(f"Scheduler manifest {yaml_file.name} must use namespace: leviathan")
         
         if not found_scheduler:
             self.fail("No CronJob or Deployment found in scheduler manifests")
-        
-        print("✓ Scheduler manifest valid")
     
+    @_section("Spider Node Manifests", "Spider manifests valid")
     def check_spider_manifests(self):
         """Validate Spider Node K8s manifests."""
-        print("\n=== Checking Spider Node Manifests ===")
-        
         spider_dir = self.repo_root / "ops" / "k8s" / "spider"
         
         if not spider_dir.exists():
             self.fail("Spider manifest directory not found: ops/k8s/spider/")
             return
         
-        yaml_files = list(spider_dir.glob("*.yaml"))
+        yaml_files = self._k8s_yaml_in(spider_dir)
         
         if not yaml_files:
             self.fail("No spider manifests found in ops/k8s/spider/")
@@ -557,11 +883,10 @@ class InvariantsChecker:
         found_service = False
         
         for yaml_file in yaml_files:
-            with open(yaml_file, 'r') as f:
-                try:
-                    docs = list(yaml.safe_load_all(f))
-                except yaml.YAMLError:
-                    continue
+            try:
+                docs = self._load_yaml_docs(yaml_file)
+            except yaml.YAMLError:
+                continue
             
             for doc in docs:
                 if not doc:
@@ -570,7 +895,7 @@ class InvariantsChecker:
                 kind = doc.get('kind')
                 
                 # Check namespace
-                namespace = doc.get('metadata', {}).get('namespace')
+                namespace = _walk(doc, ('metadata', 'namespace'))
                 if namespace != 'leviathan':
                     self.fail(f"Spider manifest {yaml_file.name} kind={kind} must use namespace: leviathan")
                 
@@ -579,8 +904,7 @@ class InvariantsChecker:
                     found_deployment = True
                     
                     # Check image pull policy for local images
-                    spec = doc.get('spec', {}).get('template', {}).get('spec', {})
-                    containers = spec.get('containers', [])
+                    containers = self._pod_spec(doc).get('containers', ())
                     
                     for container in containers:
                         image = container.get('image', '')
@@ -605,13 +929,10 @@ class InvariantsChecker:
         
         if not found_service:
             self.fail("No Service found in spider manifests")
-        
-        print("✓ Spider manifests valid")
     
+    @_section("Documentation Invariants", "Documentation invariants valid")
     def check_documentation_invariants(self):
         """Validate canonical documentation structure."""
-        print("\n=== Checking Documentation Invariants ===")
-        
         # Required canonical docs
         required_docs = [
             'docs/00_CANONICAL_OVERVIEW.md',
@@ -627,8 +948,7 @@ class InvariantsChecker:
         # Check that canonical overview references key docs
         overview_file = self.repo_root / 'docs' / '00_CANONICAL_OVERVIEW.md'
         if overview_file.exists():
-            with open(overview_file, 'r') as f:
-                content = f.read()
+            content = self._read_text(overview_file)
             
             if '07_INVARIANTS_AND_GUARDRAILS.md' not in content:
                 self.fail("00_CANONICAL_OVERVIEW.md must reference 07_INVARIANTS_AND_GUARDRAILS.md")
@@ -639,8 +959,7 @@ class InvariantsChecker:
         # Check that no canonical docs reference archived docs
         docs_dir = self.repo_root / 'docs'
         for doc_file in docs_dir.glob('*.md'):
-            with open(doc_file, 'r') as f:
-                content = f.read()
+            content = self._read_text(doc_file)
             
             # Check for references to archived docs (not in archive directory itself)
             if 'docs/archive/pre_autonomy_docs/' in content:
@@ -648,13 +967,10 @@ class InvariantsChecker:
                 pass
             elif '/archive/pre_autonomy_docs/' in content and '](docs/archive/pre_autonomy_docs/' not in content:
                 self.fail(f"{doc_file.name} references archived docs incorrectly")
-        
-        print("✓ Documentation invariants valid")
     
+    @_section("Control Plane Autonomy Mount", "Control plane autonomy mount valid")
     def check_control_plane_autonomy_mount(self):
         """Validate control plane has autonomy ConfigMap mounted correctly."""
-        print("\n=== Checking Control Plane Autonomy Mount ===")
-        
         k8s_dir = self.repo_root / "ops" / "k8s"
         control_plane_yaml = k8s_dir / "control-plane.yaml"
         
@@ -662,12 +978,11 @@ class InvariantsChecker:
             self.fail(f"Control plane manifest not found: {control_plane_yaml}")
             return
         
-        with open(control_plane_yaml, 'r') as f:
-            docs = list(yaml.safe_load_all(f))
+        by_kind = self._docs_by_kind(control_plane_yaml)
         
         # Check ConfigMap exists
-        configmap = next((d for d in docs if d.get('kind') == 'ConfigMap' and 
-                         d.get('metadata', {}).get('name') == 'leviathan-autonomy-config'), None)
+        configmap = next((d for d in by_kind.get('ConfigMap', ())
+                          if _walk(d, ('metadata', 'name')) == 'leviathan-autonomy-config'), None)
         
         if not configmap:
             self.fail("ConfigMap 'leviathan-autonomy-config' not found in control-plane.yaml. "
@@ -687,14 +1002,15 @@ class InvariantsChecker:
                      "Add 'autonomy_enabled: true' to configuration.")
         
         # Check Deployment
-        deployment = next((d for d in docs if d.get('kind') == 'Deployment' and
-                          d.get('metadata', {}).get('name') == 'leviathan-control-plane'), None)
+        deployment = next((d for d in by_kind.get('Deployment', ())
+                           if _walk(d, ('metadata', 'name')) == 'leviathan-control-plane'), None)
         
         if not deployment:
             self.fail("Control plane Deployment not found in manifest")
             return
         
-        containers = deployment.get('spec', {}).get('template', {}).get('spec', {}).get('containers', [])
+        pod_spec = self._pod_spec(deployment)
+        containers = pod_spec.get('containers', ())
         if not containers:
             self.fail("No containers found in control plane Deployment")
             return
@@ -732,7 +1048,7 @@ class InvariantsChecker:
                          "ConfigMap should be mounted read-only.")
         
         # Check volume
-        volumes = deployment.get('spec', {}).get('template', {}).get('spec', {}).get('volumes', [])
+        volumes = pod_spec.get('volumes', ())
         autonomy_volume = next((v for v in volumes if v.get('name') == 'autonomy-config'), None)
         
         if not autonomy_volume:
@@ -744,21 +1060,17 @@ class InvariantsChecker:
             if configmap_name != 'leviathan-autonomy-config':
                 self.fail(f"autonomy-config volume should reference ConfigMap 'leviathan-autonomy-config', "
                          f"got '{configmap_name}'")
-        
-        if not self.failures or all('autonomy' not in f.lower() for f in self.failures[-10:]):
-            print("✓ Control plane autonomy mount valid")
     
+    @_section("Console Manifests", "Console manifests valid")
     def check_console_manifests(self):
         """Validate Console K8s manifests."""
-        print("\n=== Checking Console Manifests ===")
-        
         console_dir = self.repo_root / "ops" / "k8s" / "console"
         
         if not console_dir.exists():
             self.fail("Console manifest directory not found: ops/k8s/console/")
             return
         
-        yaml_files = list(console_dir.glob("*.yaml"))
+        yaml_files = self._k8s_yaml_in(console_dir)
         
         if not yaml_files:
             self.fail("No console manifests found in ops/k8s/console/")
@@ -768,11 +1080,10 @@ class InvariantsChecker:
         found_service = False
         
         for yaml_file in yaml_files:
-            with open(yaml_file, 'r') as f:
-                try:
-                    docs = list(yaml.safe_load_all(f))
-                except yaml.YAMLError:
-                    continue
+            try:
+                docs = self._load_yaml_docs(yaml_file)
+            except yaml.YAMLError:
+                continue
             
             for doc in docs:
                 if not doc:
@@ -781,7 +1092,7 @@ class InvariantsChecker:
                 kind = doc.get('kind')
                 
                 # Check namespace
-                namespace = doc.get('metadata', {}).get('namespace')
+                namespace = _walk(doc, ('metadata', 'namespace'))
                 if namespace != 'leviathan':
                     self.fail(f"Console manifest {yaml_file.name} kind={kind} must use namespace: leviathan")
                 
@@ -790,8 +1101,7 @@ class InvariantsChecker:
                     found_deployment = True
                     
                     # Check image pull policy for local images
-                    spec = doc.get('spec', {}).get('template', {}).get('spec', {})
-                    containers = spec.get('containers', [])
+                    containers = self._pod_spec(doc).get('containers', ())
                     
                     for container in containers:
                         image = container.get('image', '')
@@ -814,14 +1124,10 @@ class InvariantsChecker:
         console_dockerfile = self.repo_root / "ops" / "docker" / "console.Dockerfile"
         if not console_dockerfile.exists():
             self.fail("Console Dockerfile not found: ops/docker/console.Dockerfile")
-        
-        if not self.failures:
-            print("✓ Console manifests valid")
     
+    @_section("Kustomize Structure", "Kustomize structure valid")
     def check_kustomize_structure(self):
         """Validate Kustomize base and overlays structure."""
-        print("\n=== Checking Kustomize Structure ===")
-        
         # Check base exists
         base_dir = self.repo_root / "ops" / "k8s" / "base"
         if not base_dir.exists():
@@ -852,55 +1158,53 @@ class InvariantsChecker:
         for overlay_name in ['kind', 'eks']:
             overlay_file = overlays_dir / overlay_name / "kustomization.yaml"
             if overlay_file.exists():
-                with open(overlay_file, 'r') as f:
-                    content = f.read()
-                    if ':latest' in content:
-                        self.fail(f"{overlay_name} overlay uses forbidden ':latest' tag")
-        
-        if not self.failures:
-            print("✓ Kustomize structure valid")
+                if ':latest' in self._read_text(overlay_file):
+                    self.fail(f"{overlay_name} overlay uses forbidden ':latest' tag")
     
     def run_all_checks(self) -> bool:
         """Run all invariant checks."""
-        print("Leviathan Invariants Gate")
-        print("=" * 60)
-        
-        self.check_k8s_control_plane()
-        self.check_k8s_worker_job()
-        self.check_ci_workflows()
-        self.check_requirements()
-        self.check_namespace_consistency()
-        self.check_topology_artifacts()
-        self.check_topology_api_endpoints()
-        self.check_failover_documentation()
-        self.check_failover_backends()
-        self.check_k8s_packaging()
-        self.check_autonomy_config()
-        self.check_scheduler_manifest()
-        self.check_spider_manifests()
-        self.check_console_manifests()
-        self.check_kustomize_structure()
-        self.check_documentation_invariants()
-        self.check_control_plane_autonomy_mount()
-        
-        print("\n" + "=" * 60)
-        
-        if self.failures:
-            print(f"\n❌ FAILED: {len(self.failures)} invariant(s) violated")
-            print("\nFailures:")
-            for i, failure in enumerate(self.failures, 1):
-                print(f"  {i}. {failure}")
-            return False
-        else:
-            print("\n✅ SUCCESS: All invariants validated")
-            return True
+        self._log("Leviathan Invariants Gate")
+        self._log("=" * 60)
+        
+        try:
+            for name in self.CHECKS:
+                # With fast_fail, stop once a check fails
+                if self._run_check(name) and self.fast_fail:
+                    break
+            
+            self._log("\n" + "=" * 60)
+            
+            if self.failures:
+                self._log(f"\n❌ FAILED: {len(self.failures)} invariant(s) violated")
+                self._log("\nFailures:")
+                for i, failure in enumerate(self.failures, 1):
+                    self._log(f"  {i}. {failure}")
+            else:
+                self._log("\n✅ SUCCESS: All invariants validated")
+        finally:
+            self.close()
+            # One write for the whole report instead of a print() per line; also
+            # emits the partial report if the run is interrupted
+            sys.stdout.write(''.join(self._out))
+            sys.stdout.flush()
+            self._out.clear()
+        
+        return not self.failures
 
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Validate repository files against ops/invariants.yaml")
+    parser.add_argument(
+        '--fast-fail',
+        action='store_true',
+        help="stop at the first check that reports a failure",
+    )
+    args = parser.parse_args()
+    
     repo_root = Path(__file__).parent.parent
     
-    checker = InvariantsChecker(repo_root)
+    checker = InvariantsChecker(repo_root, fast_fail=args.fast_fail)
     success = checker.run_all_checks()
     
     sys.exit(0 if success else 1)